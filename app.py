@@ -67,11 +67,16 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-@st.cache_data
+@st.cache_resource
+def get_data_loader():
+    """Create the shared DataLoader once so reruns don't re-read the data"""
+    return DataLoader()
+
+@st.cache_resource
 def load_data():
     """Load and cache data"""
     try:
-        data_loader = DataLoader()
+        data_loader = get_data_loader()
         summary = data_loader.get_summary()
         return data_loader, summary
     except Exception as e:
@@ -357,8 +362,7 @@ def display_player_analysis(analysis):
     st.info("💡 **Consejo**: Escribe al menos 2 caracteres del nombre del jugador para ver sugerencias. El sistema funciona con nombres completos, parciales, con o sin acentos.")
     
     # Get data loader for suggestions
-    from src.utils.data_loader import DataLoader
-    data_loader = DataLoader()
+    data_loader = get_data_loader()
     
     # Use the new selection interface
     player_name = display_player_selection_interface(data_loader, "player")
@@ -561,8 +565,7 @@ def display_similar_players(analysis):
     st.info("💡 **Consejo**: Escribe al menos 2 caracteres del nombre del jugador de referencia para ver sugerencias. El sistema encuentra jugadores con estilos de juego similares.")
     
     # Get data loader for suggestions
-    from src.utils.data_loader import DataLoader
-    data_loader = DataLoader()
+    data_loader = get_data_loader()
     
     # Use the new selection interface
     reference_player = display_player_selection_interface(data_loader, "similar_player")
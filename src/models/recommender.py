@@ -39,8 +39,10 @@ class PlayerRecommender:
         Args:
             min_minutes: Minutos mínimos jugados para considerar jugador (podemos cambiarlo a consideración del DT)
         """
-        # Cargar datos filtrados
-        self.df = self.data_loader.get_players(min_minutes=min_minutes)
+        # Cargar datos filtrados. El loader guarda las features normalizadas en
+        # float32; los scores del recomendador se calculan y devuelven en float64
+        players = self.data_loader.get_players(min_minutes=min_minutes)
+        self.df = players.astype({col: np.float64 for col in NORMALIZED_FEATURES if col in players.columns})
         
         # Preparar features
         self.features = self.df[NORMALIZED_FEATURES].fillna(0)
@@ -88,7 +90,7 @@ class PlayerRecommender:
         if not player_mask.any():
             available = self.df['player_name'].str.contains(player_name.split()[0], case=False, na=False)
             if available.any():
-                suggestions = self.df[available]['player_name'].unique()[:5]
+                suggestions = self.df[available]['player_name'].unique()[:5].tolist()
                 raise ValueError(f"Jugador '{player_name}' no encontrado. ¿Quisiste decir: {suggestions}?")
             raise ValueError(f"Jugador '{player_name}' no encontrado")
         
@@ -1,6 +1,7 @@
 """
 Perfilador del Club América - Versión optimizada con PCA
 """
+import sys
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple
@@ -35,8 +36,11 @@ class AmericaProfiler:
         Returns:
             Perfil completo con rankings
         """
-        print(f"Construyendo perfil del {team_name}...")
-        print(f"Analizando {len(seasons)} temporadas\n")
+        # Los mensajes de progreso se acumulan y se escriben de una sola vez
+        log_lines = [
+            f"Construyendo perfil del {team_name}...",
+            f"Analizando {len(seasons)} temporadas\n",
+        ]
         
         # Recopilar datos
         all_team_stats = []
@@ -44,10 +48,12 @@ class AmericaProfiler:
         all_matches = []
         
         for comp_id, season_id in seasons:
-            print(f"Temporada {season_id}...")
+            log_lines.append(f"Temporada {season_id}...")
             
             try:
                 team_stats = self.fetcher.get_team_season_stats(comp_id, season_id)
+                # Cadenas respaldadas por Arrow: str.contains corre en C, no celda por celda
+                team_stats['team_name'] = team_stats['team_name'].astype('string[pyarrow]')
                 all_team_stats.append(team_stats)
                 
                 america_data = team_stats[
@@ -55,28 +61,33 @@ class AmericaProfiler:
                 ]
                 
                 if not america_data.empty:
-                    america_stats.append(america_data.iloc[0])
-                    print(f"Stats obtenidas")
+                    america_stats.append(america_data.iloc[[0]])
+                    log_lines.append("Stats obtenidas")
                 
                 matches = self.fetcher.get_matches(comp_id, season_id)
+                matches[['home_team', 'away_team']] = matches[['home_team', 'away_team']].astype('string[pyarrow]')
+                # Búsqueda literal (sin regex) sobre ambas columnas en minúsculas
+                needle = team_name.lower()
+                teams_lower = matches[['home_team', 'away_team']].apply(lambda col: col.str.lower())
                 america_matches = matches[
-                    (matches['home_team'].str.contains(team_name, case=False, na=False)) |
-                    (matches['away_team'].str.contains(team_name, case=False, na=False))
+                    teams_lower.apply(lambda col: col.str.contains(needle, regex=False, na=False)).any(axis=1)
                 ]
                 
                 if not america_matches.empty:
                     all_matches.append(america_matches)
-                    print(f"{len(america_matches)} partidos")
+                    log_lines.append(f"{len(america_matches)} partidos")
                     
             except Exception as e:
-                print(f"Error: {e}")
+                log_lines.append(f"Error: {e}")
+        
+        sys.stdout.write("\n".join(log_lines) + "\n")
         
         if not america_stats:
             raise ValueError("No se encontraron datos del América")
         
         # Consolidar
         self.all_teams_data = pd.concat(all_team_stats, ignore_index=True)
-        self.seasons_data = pd.DataFrame(america_stats)
+        self.seasons_data = pd.concat(america_stats)
         matches_df = pd.concat(all_matches, ignore_index=True) if all_matches else pd.DataFrame()
         
         print(f"\nConsolidado: {len(self.seasons_data)} temporadas, {len(matches_df)} partidos")
@@ -106,31 +117,21 @@ class AmericaProfiler:
             'dimensions': {}     # Scores por dimensión
         }
         
+        # Estadísticas por métrica (media, desviación, primera y última temporada)
+        stats = self._season_metric_stats()
+        
         # 1. PROMEDIOS por dimensión
         for dimension, metrics in AMERICA_CORE_METRICS.items():
-            values = []
-            for metric in metrics:
-                if metric in self.seasons_data.columns:
-                    values.append(self.seasons_data[metric].mean())
-            
-            profile['averages'][dimension] = np.mean(values) if values else 0.0
+            present = [m for m in metrics if m in stats.index]
+            profile['averages'][dimension] = float(stats.loc[present, 'mean'].mean()) if present else 0.0
         
         # 2. TENDENCIAS (primera vs última temporada)
         if len(self.seasons_data) >= 2:
-            first_season = self.seasons_data.iloc[0]
-            last_season = self.seasons_data.iloc[-1]
-            
             for dimension, metrics in AMERICA_CORE_METRICS.items():
-                values_first = []
-                values_last = []
-                
-                for metric in metrics:
-                    if metric in self.seasons_data.columns:
-                        values_first.append(first_season[metric])
-                        values_last.append(last_season[metric])
+                present = [m for m in metrics if m in stats.index]
                 
-                if values_first and values_last:
-                    trend = np.mean(values_last) - np.mean(values_first)
+                if present:
+                    trend = float(stats.loc[present, 'last'].mean() - stats.loc[present, 'first'].mean())
                     profile['trends'][dimension] = {
                         'change': trend,
                         'direction': 'mejorando' if trend > 0 else 'empeorando' if trend < 0 else 'estable'
@@ -138,12 +139,8 @@ class AmericaProfiler:
         
         # 3. CONSISTENCIA (desviación estándar)
         for dimension, metrics in AMERICA_CORE_METRICS.items():
-            stds = []
-            for metric in metrics:
-                if metric in self.seasons_data.columns:
-                    stds.append(self.seasons_data[metric].std())
-            
-            profile['consistency'][dimension] = np.mean(stds) if stds else 0.0
+            present = [m for m in metrics if m in stats.index]
+            profile['consistency'][dimension] = float(stats.loc[present, 'std'].mean()) if present else 0.0
         
         # 4. RANKINGS (percentiles vs otros equipos)
         profile['rankings'] = self._calculate_rankings()
@@ -155,6 +152,27 @@ class AmericaProfiler:
         
         return profile
     
+    def _season_metric_stats(self) -> pd.DataFrame:
+        """
+        Calcula media, desviación estándar, primera y última temporada de cada
+        métrica clave en una sola pasada sobre los datos del América
+        
+        Returns:
+            DataFrame indexado por métrica con columnas mean, std, first y last
+        """
+        metrics = [
+            metric for metrics in AMERICA_CORE_METRICS.values() for metric in metrics
+            if metric in self.seasons_data.columns
+        ]
+        values = self.seasons_data[metrics].to_numpy(dtype=np.float64)
+        
+        return pd.DataFrame({
+            'mean': np.nanmean(values, axis=0),
+            'std': np.nanstd(values, axis=0, ddof=1),
+            'first': values[0],
+            'last': values[-1]
+        }, index=metrics)
+    
     def _calculate_rankings(self) -> Dict:
         """Calcula percentiles del América vs todos los equipos"""
         rankings = {}
@@ -165,14 +183,19 @@ class AmericaProfiler:
             for metric in metrics:
                 if metric in self.all_teams_data.columns:
                     # Valor promedio del América
-                    america_value = self.seasons_data[metric].mean()
+                    america_value = float(self.seasons_data[metric].mean())
                     
                     # Distribución de todos los equipos
-                    all_values = self.all_teams_data[metric].dropna()
+                    all_values = self.all_teams_data[metric].to_numpy(dtype=np.float64)
+                    all_values = all_values[~np.isnan(all_values)]
                     
-                    if len(all_values) > 0:
-                        # Calcular percentil
-                        percentile = (all_values <= america_value).sum() / len(all_values) * 100
+                    if all_values.size > 0:
+                        # Calcular percentil (rango medio: los empates cuentan la mitad)
+                        rank = (
+                            np.count_nonzero(all_values < america_value)
+                            + 0.5 * np.count_nonzero(all_values == america_value)
+                        )
+                        percentile = rank / all_values.size * 100
                         percentiles.append(percentile)
             
             rankings[dimension] = np.mean(percentiles) if percentiles else 50.0
@@ -184,16 +207,12 @@ class AmericaProfiler:
         if matches.empty:
             return 0.0
         
-        wins = 0
-        for _, match in matches.iterrows():
-            is_home = 'América' in str(match.get('home_team', ''))
-            home_score = match.get('home_score', 0)
-            away_score = match.get('away_score', 0)
-            
-            if is_home and home_score > away_score:
-                wins += 1
-            elif not is_home and away_score > home_score:
-                wins += 1
+        # Kernel vectorizado: una comparación por columna en lugar de iterrows
+        is_home = matches['home_team'].str.contains('América', regex=False, na=False).to_numpy(dtype=bool)
+        home_score = np.asarray(matches.get('home_score', 0), dtype=np.float64)
+        away_score = np.asarray(matches.get('away_score', 0), dtype=np.float64)
+        
+        wins = np.count_nonzero(np.where(is_home, home_score > away_score, away_score > home_score))
         
         return (wins / len(matches)) * 100
     
@@ -0,0 +1,361 @@
+"""
+Caché en disco para resultados de la API de StatsBomb
+"""
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import pickle
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+# Directorio por defecto (se puede cambiar con la variable STATSBOMB_CACHE_DIR)
+DEFAULT_CACHE_DIR = Path(
+    os.getenv('STATSBOMB_CACHE_DIR', Path.home() / '.cache' / 'statsbomb')
+)
+
+# Tiempo de vida por defecto de una entrada (7 días)
+DEFAULT_MAX_AGE = 7 * 24 * 60 * 60
+
+
+def _json_default(value: Any) -> Any:
+    # Los escalares de NumPy (ej: ids leídos de un DataFrame) se tratan como nativos
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+def _strict_json_default(value: Any) -> Any:
+    # Como _json_default pero sin recurrir a str(): la representación de un objeto
+    # arbitrario puede incluir su dirección de memoria y cambiar en cada proceso
+    if hasattr(value, 'item'):
+        return value.item()
+    raise TypeError(f"Dependencia no serializable para la llave de caché: {type(value).__name__}")
+
+
+def _dependency_source(dep: Any) -> str:
+    """
+    Representación estable de una dependencia de `memoize_frame`
+
+    Args:
+        dep: Función, método (incluidos classmethod/staticmethod y funciones
+            envueltas con lru_cache) o constante serializable a JSON
+
+    Returns:
+        Código fuente de la función original o JSON de la constante
+
+    Raises:
+        TypeError: Si la dependencia no es una función ni serializable a JSON
+    """
+    # Los classmethod/staticmethod sin enlazar no son invocables: se usa la función
+    if isinstance(dep, (classmethod, staticmethod)):
+        dep = dep.__func__
+    if callable(dep):
+        return inspect.getsource(inspect.unwrap(dep))
+    return json.dumps(dep, sort_keys=True, default=_strict_json_default)
+
+
+def cache_key(params: Dict) -> str:
+    """
+    Genera una llave estable a partir de un diccionario de parámetros
+
+    Args:
+        params: Parámetros que identifican la llamada (endpoint, ids, opciones)
+
+    Returns:
+        Hash hexadecimal (blake2b) de los parámetros ordenados
+    """
+    payload = json.dumps(params, sort_keys=True, default=_json_default)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """
+    Huella del contenido de un DataFrame (valores, índice, columnas y tipos)
+
+    Args:
+        df: DataFrame a identificar
+
+    Returns:
+        Hash hexadecimal (blake2b) del contenido
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    digest.update(json.dumps([[str(col), str(dtype)] for col, dtype in df.dtypes.items()]).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def memoize_frame(method: Optional[Callable] = None, *, depends: tuple = ()) -> Callable:
+    """
+    Decorador para métodos DataFrame -> DataFrame sin otros argumentos.
+    Guarda el resultado en `self.memo` (un DiskCache, si existe) con una llave
+    que combina el contenido de la entrada y el código fuente del método, de
+    modo que un cambio en cualquiera de los dos invalida la entrada.
+    
+    Args:
+        method: Método a decorar (se puede usar como `@memoize_frame` o
+            `@memoize_frame(depends=...)`)
+        depends: Otros valores de los que depende el resultado (constantes del
+            módulo o funciones auxiliares, de las que se usa su código fuente);
+            cambiarlos también invalida la entrada
+
+    Raises:
+        TypeError: Si alguna dependencia no es una función ni serializable a JSON
+    """
+    if method is None:
+        return lambda fn: memoize_frame(fn, depends=depends)
+    
+    sources = [inspect.getsource(method)] + [_dependency_source(dep) for dep in depends]
+    source_hash = hashlib.blake2b('\n'.join(sources).encode('utf-8'), digest_size=16).hexdigest()
+
+    @functools.wraps(method)
+    def wrapper(self, df: pd.DataFrame, *args, **kwargs) -> pd.DataFrame:
+        memo = getattr(self, 'memo', None)
+        if memo is None or args or kwargs:
+            return method(self, df, *args, **kwargs)
+
+        params = {
+            'function': method.__qualname__,
+            'source': source_hash,
+            'data': frame_fingerprint(df),
+        }
+        return memo.get_or_load(params, lambda: method(self, df))
+
+    return wrapper
+
+
+def _parquet_safe(df: pd.DataFrame) -> bool:
+    """
+    Indica si un DataFrame vuelve igual desde Parquet. Arrow acepta listas y
+    diccionarios anidados (ubicaciones, tácticas, freeze_frame), pero los
+    devuelve como arreglos de NumPy o diccionarios con todas las claves, así
+    que solo se usa Parquet si toda columna object contiene solo texto (el
+    mismo criterio que StatsBombDataFetcher._arrow_strings)
+    """
+    return all(
+        pd.api.types.infer_dtype(df[col], skipna=True) == 'string'
+        for col in df.select_dtypes(include='object').columns
+    )
+
+
+def write_frame(df: pd.DataFrame, stem: Path) -> Path:
+    """
+    Guarda un DataFrame en `stem`.parquet (o `stem`.pkl si tiene columnas
+    anidadas o Arrow no lo soporta) con escritura atómica
+
+    Args:
+        df: DataFrame a guardar
+        stem: Ruta del archivo sin extensión
+
+    Returns:
+        Ruta del archivo escrito
+    """
+    stem = Path(stem)
+    stem.parent.mkdir(parents=True, exist_ok=True)
+
+    if _parquet_safe(df):
+        path = stem.with_name(f"{stem.name}.parquet")
+        tmp_path = DiskCache._tmp_path(path)
+        try:
+            df.to_parquet(tmp_path, compression='zstd')
+            os.replace(tmp_path, path)
+            stem.with_name(f"{stem.name}.pkl").unlink(missing_ok=True)
+            return path
+        except Exception:
+            # Tipos que Arrow no soporta: se guarda en pickle
+            tmp_path.unlink(missing_ok=True)
+
+    path = stem.with_name(f"{stem.name}.pkl")
+    tmp_path = DiskCache._tmp_path(path)
+    try:
+        df.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+        # Una copia Parquet anterior tendría prioridad al leer
+        stem.with_name(f"{stem.name}.parquet").unlink(missing_ok=True)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return path
+
+
+def frame_exists(stem: Path) -> bool:
+    """
+    Indica si hay un DataFrame guardado con `write_frame` en `stem`
+
+    Args:
+        stem: Ruta del archivo sin extensión
+
+    Returns:
+        True si existe la copia Parquet o la pickle
+    """
+    stem = Path(stem)
+    return (stem.with_name(f"{stem.name}.parquet").exists()
+            or stem.with_name(f"{stem.name}.pkl").exists())
+
+
+def read_frame(stem: Path, columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+    """
+    Lee un DataFrame guardado con `write_frame`
+
+    Args:
+        stem: Ruta del archivo sin extensión
+        columns: Columnas a leer (opcional; en Parquet solo se leen esas columnas)
+
+    Returns:
+        DataFrame leído o None si no existe
+    """
+    stem = Path(stem)
+    columns = columns or None
+
+    parquet_path = stem.with_name(f"{stem.name}.parquet")
+    if parquet_path.exists():
+        if columns:
+            available = set(pq.read_schema(parquet_path).names)
+            columns = [col for col in columns if col in available]
+        return pd.read_parquet(parquet_path, columns=columns)
+
+    pickle_path = stem.with_name(f"{stem.name}.pkl")
+    if pickle_path.exists():
+        df = pd.read_pickle(pickle_path)
+        return df[[col for col in columns if col in df.columns]] if columns else df
+
+    return None
+
+
+class DiskCache:
+    """
+    Caché persistente: DataFrames de columnas planas en Parquet y el resto de
+    objetos (incluidos DataFrames con columnas anidadas) en pickle.
+    Los resultados vacíos no se guardan para no persistir respuestas fallidas.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_age: Optional[float] = DEFAULT_MAX_AGE):
+        """
+        Inicializa la caché
+
+        Args:
+            cache_dir: Directorio de la caché (opcional)
+            max_age: Segundos de validez de cada entrada (None = sin expiración)
+        """
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR).expanduser()
+        self.max_age = max_age
+
+    def get_or_load(self, params: Dict, loader_fn: Callable[[], Any], fmt: str = 'parquet',
+                    refresh: bool = False) -> Any:
+        """
+        Devuelve el valor guardado para `params` o lo obtiene con `loader_fn`
+
+        Args:
+            params: Parámetros que identifican la llamada
+            loader_fn: Función que obtiene el valor si no está en caché
+            fmt: Formato preferido ('parquet' para DataFrames, 'pickle' para el resto)
+            refresh: Ignorar la entrada guardada y volver a obtener el valor
+
+        Returns:
+            Valor guardado o recién obtenido
+        """
+        key = cache_key(params)
+
+        if not refresh:
+            cached = self._read(key)
+            if cached is not None:
+                return cached
+
+        value = loader_fn()
+        self._write(key, value, fmt)
+        return value
+
+    def prune(self) -> int:
+        """
+        Borra las entradas vencidas (más antiguas que `max_age`) y los archivos
+        temporales que dejaron escrituras interrumpidas
+
+        Returns:
+            Número de archivos borrados
+        """
+        if self.max_age is None or not self.cache_dir.is_dir():
+            return 0
+
+        cutoff = time.time() - self.max_age
+        removed = 0
+        for path in self.cache_dir.iterdir():
+            if path.suffix not in ('.parquet', '.pkl', '.tmp'):
+                continue
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                # Otro proceso la borró o reemplazó al mismo tiempo
+                continue
+
+        if removed:
+            logger.debug("Caché %s: %d entradas vencidas borradas", self.cache_dir, removed)
+        return removed
+
+    def _paths(self, key: str) -> Dict[str, Path]:
+        return {
+            'parquet': self.cache_dir / f"{key}.parquet",
+            'pickle': self.cache_dir / f"{key}.pkl",
+        }
+
+    @staticmethod
+    def _tmp_path(path: Path) -> Path:
+        # Nombre temporal único para que escrituras concurrentes no se pisen
+        return path.parent / f"{path.name}.{uuid.uuid4().hex}.tmp"
+
+    def _is_fresh(self, path: Path) -> bool:
+        if not path.exists():
+            return False
+        if self.max_age is None:
+            return True
+        return (time.time() - path.stat().st_mtime) < self.max_age
+
+    def _read(self, key: str) -> Any:
+        paths = self._paths(key)
+        try:
+            if self._is_fresh(paths['parquet']):
+                return pd.read_parquet(paths['parquet'])
+            if self._is_fresh(paths['pickle']):
+                with open(paths['pickle'], 'rb') as f:
+                    return pickle.load(f)
+        except Exception as e:
+            logger.warning("Entrada de caché ilegible, se vuelve a descargar: %s", e)
+        return None
+
+    def _write(self, key: str, value: Any, fmt: str):
+        if value is None or len(value) == 0:
+            return
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        paths = self._paths(key)
+
+        # Columnas anidadas (ubicaciones, tácticas...): pickle, que las conserva tal cual
+        if fmt == 'parquet' and isinstance(value, pd.DataFrame) and _parquet_safe(value):
+            tmp_path = self._tmp_path(paths['parquet'])
+            try:
+                value.to_parquet(tmp_path, compression='zstd')
+                os.replace(tmp_path, paths['parquet'])
+                return
+            except Exception:
+                # Tipos que Arrow no soporta: se guarda en pickle
+                tmp_path.unlink(missing_ok=True)
+
+        tmp_path = self._tmp_path(paths['pickle'])
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, paths['pickle'])
+            # Una copia Parquet anterior tendría prioridad al leer
+            paths['parquet'].unlink(missing_ok=True)
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            logger.warning("No se pudo guardar en caché: %s", e)
@@ -1,16 +1,175 @@
 """
 Módulo para obtener datos de StatsBomb
 """
+import asyncio
+import logging
+import os
+import re
+import shutil
+import uuid
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 from statsbombpy import sb
-from typing import List, Dict, Optional
-from .statsbomb_config import StatsBombConfig
+from typing import Any, Callable, List, Dict, Optional
+from .statsbomb_config import MAX_WORKERS, StatsBombConfig
+from .cache import DiskCache, frame_exists, read_frame, write_frame
+
+logger = logging.getLogger(__name__)
+
+# Máximo de descargas de eventos simultáneas en get_events_batch
+EVENTS_CONCURRENCY = 8
+
+# Columnas que identifican la competición de cada partido en la tabla local
+MATCH_INDEX_COLUMNS = ['match_id', 'competition_id', 'season_id', 'competition_name', 'season_name']
+
+# Columnas de texto con pocos valores distintos que se guardan como categóricas
+COMPETITION_CATEGORY_COLUMNS = ['country_name', 'competition_name', 'season_name', 'competition_gender']
+MATCH_CATEGORY_COLUMNS = ['home_team', 'away_team']
+
+# Variaciones del nombre del Club América en los datos de StatsBomb
+_AMERICA_VARIANTS = frozenset({'Club América', 'America', 'CF América', 'Club America'})
+_AMERICA_VARIANTS_LOWER = frozenset(variant.lower() for variant in _AMERICA_VARIANTS)
+
+
+@lru_cache(maxsize=1)
+def _shared_config() -> StatsBombConfig:
+    """
+    Configuración compartida por todos los fetchers del proceso: las
+    credenciales se leen y validan una sola vez
+    """
+    return StatsBombConfig()
+
 
 class StatsBombDataFetcher:
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[Path] = None, use_cache: bool = True,
+                 force_refresh: bool = False):
+        """
+        Inicializa el cliente de StatsBomb
         
-        self.config = StatsBombConfig()
+        Args:
+            cache_dir: Directorio de la caché en disco (por defecto ~/.cache/statsbomb)
+            use_cache: Guardar y reutilizar las respuestas de la API en disco
+            force_refresh: Volver a descargar todo e ir actualizando la caché
+        """
+        self.config = _shared_config()
         self.creds = self.config.get_credentials()
+        self.cache = DiskCache(cache_dir) if use_cache else None
+        self.force_refresh = force_refresh
+        self._all_matches = None
+        self._competitions_df = None
+    
+    def _cached(self, key: Dict, loader_fn: Callable[[], Any], fmt: str = 'parquet',
+                refresh: bool = False) -> Any:
+        """
+        Sirve una llamada a la API desde la caché en disco, descargándola solo
+        la primera vez
+        
+        Args:
+            key: Endpoint y parámetros que identifican la llamada
+            loader_fn: Función que hace la llamada real a la API
+            fmt: 'parquet' para DataFrames, 'pickle' para diccionarios
+            refresh: Volver a descargar aunque haya una entrada vigente
+        
+        Returns:
+            Resultado de la llamada
+        """
+        if self.cache is None:
+            return loader_fn()
+        return self.cache.get_or_load(key, loader_fn, fmt, refresh=refresh or self.force_refresh)
+    
+    @staticmethod
+    def _as_categories(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+        """Convierte a categóricas las columnas indicadas que existan en el DataFrame"""
+        present = [col for col in columns if col in df.columns]
+        if present:
+            df = df.astype({col: 'category' for col in present})
+        return df
+    
+    @staticmethod
+    def _contains_lower(series: pd.Series, needle: str) -> pd.Series:
+        """
+        Máscara de filas cuyo texto contiene `needle` (ya en minúsculas)
+        
+        Args:
+            series: Columna de texto (categórica o no)
+            needle: Subcadena a buscar, en minúsculas
+        
+        Returns:
+            Serie booleana alineada con `series`
+        """
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Solo se compara cada nombre distinto una vez
+            categories = series.cat.categories
+            matched = categories[categories.astype('string[pyarrow]').str.lower().str.contains(needle, regex=False)]
+            return series.isin(matched)
+        
+        return series.astype('string[pyarrow]').str.lower().str.contains(needle, regex=False).fillna(False).astype(bool)
+    
+    @staticmethod
+    def _isin_lower(series: pd.Series, values: frozenset) -> np.ndarray:
+        """
+        Máscara de filas cuyo texto en minúsculas está en `values`
+        
+        Args:
+            series: Columna de texto (categórica o no)
+            values: Valores aceptados, en minúsculas
+        
+        Returns:
+            Arreglo booleano alineado con `series`
+        """
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Solo se pasa a minúsculas cada nombre distinto una vez
+            categories = series.cat.categories
+            return series.isin(categories[categories.str.lower().isin(values)]).to_numpy()
+        
+        return series.str.lower().isin(values).to_numpy()
+    
+    @staticmethod
+    def _arrow_strings(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Pasa a string[pyarrow] las columnas object que solo contienen texto.
+        Las columnas con listas o diccionarios (ubicaciones, atributos anidados)
+        se dejan como object.
+        
+        Args:
+            df: DataFrame devuelto por la API
+        
+        Returns:
+            DataFrame con las columnas de texto respaldadas por Arrow
+        """
+        text_columns = {
+            col: 'string[pyarrow]'
+            for col in df.select_dtypes(include='object').columns
+            if pd.api.types.infer_dtype(df[col], skipna=True) == 'string'
+        }
+        return df.astype(text_columns) if text_columns else df
+    
+    @staticmethod
+    def _project(df: pd.DataFrame, columns: Optional[List[str]]) -> pd.DataFrame:
+        """Conserva solo las columnas pedidas (las inexistentes se ignoran)"""
+        if not columns:
+            return df
+        return df[[col for col in columns if col in df.columns]]
+    
+    def _fetch_many(self, fn: Callable, arg_list: List[Dict]) -> List:
+        """
+        Ejecuta varias llamadas independientes a la API en paralelo
+        
+        Args:
+            fn: Método a llamar (ej: self.get_matches)
+            arg_list: Lista de kwargs, uno por llamada
+        
+        Returns:
+            Resultados en el mismo orden que arg_list
+        """
+        if not arg_list:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(arg_list))) as executor:
+            return list(executor.map(lambda kwargs: fn(**kwargs), arg_list))
     
     def get_competitions(self, country: str = None, division: str = None, 
                         season: str = None, gender: str = None) -> pd.DataFrame:
@@ -27,60 +186,98 @@ class StatsBombDataFetcher:
             DataFrame con las competiciones filtradas
         """
         try:
-            print("Obteniendo competiciones...")
-            competitions = sb.competitions(creds=self.creds)
+            logger.debug("Obteniendo competiciones...")
+            competitions = self._raw_competitions()
+            
+            # Aplicar filtros en una sola máscara (comparación de códigos categóricos)
+            mask = np.ones(len(competitions), dtype=bool)
             
-            # Aplicar filtros
             if country:
-                competitions = competitions[competitions['country_name'] == country]
-                print(f"Filtrado por país: {country}")
+                mask &= (competitions['country_name'] == country).to_numpy(dtype=bool)
+                logger.debug("Filtrado por país: %s", country)
             
             if division:
-                competitions = competitions[competitions['competition_name'] == division]
-                print(f"Filtrado por división: {division}")
+                mask &= (competitions['competition_name'] == division).to_numpy(dtype=bool)
+                logger.debug("Filtrado por división: %s", division)
             
             if season:
-                competitions = competitions[competitions['season_name'] == season]
-                print(f"Filtrado por temporada: {season}")
+                mask &= (competitions['season_name'] == season).to_numpy(dtype=bool)
+                logger.debug("Filtrado por temporada: %s", season)
             
             if gender:
-                competitions = competitions[competitions['competition_gender'] == gender]
-                print(f"Filtrado por género: {gender}")
+                mask &= (competitions['competition_gender'] == gender).to_numpy(dtype=bool)
+                logger.debug("Filtrado por género: %s", gender)
+            
+            competitions = competitions.loc[mask]
 
-            print(f"{len(competitions)} competiciones obtenidas")
+            logger.debug("%s competiciones obtenidas", len(competitions))
             return competitions
             
         except Exception as e:
-            print(f"Error obteniendo competiciones: {e}")
+            logger.warning("Error obteniendo competiciones: %s", e)
             return pd.DataFrame()
     
-    def get_matches(self, competition_id: int, season_id: int) -> pd.DataFrame:
+    def _raw_competitions(self, refresh: bool = False) -> pd.DataFrame:
+        """
+        Devuelve todas las competiciones sin filtrar, descargándolas solo una vez
+        por instancia
+        
+        Args:
+            refresh: Volver a descargarlas ignorando la caché en disco
+        
+        Returns:
+            DataFrame con todas las competiciones
+        """
+        if self._competitions_df is None or refresh:
+            competitions = self._cached(
+                {'endpoint': 'competitions'},
+                lambda: sb.competitions(creds=self.creds),
+                refresh=refresh
+            )
+            
+            # Solo se memoriza una respuesta válida
+            if competitions.empty:
+                return competitions
+            self._competitions_df = self._arrow_strings(
+                self._as_categories(competitions, COMPETITION_CATEGORY_COLUMNS)
+            )
+        
+        return self._competitions_df
+    
+    def get_matches(self, competition_id: int, season_id: int, refresh: bool = False) -> pd.DataFrame:
         """
         Obtiene los partidos de una competición y temporada
         
         Args:
             competition_id: ID de la competición
             season_id: ID de la temporada
+            refresh: Volver a descargarlos ignorando la caché en disco
         
         Returns:
             DataFrame con los partidos
         """
         try:
-            print(f"Obteniendo partidos (Comp: {competition_id}, Temp: {season_id})...")
-            matches = sb.matches(
-                competition_id=competition_id, 
-                season_id=season_id,
-                creds=self.creds
+            logger.debug("Obteniendo partidos (Comp: %s, Temp: %s)...", competition_id, season_id)
+            matches = self._cached(
+                {'endpoint': 'matches', 'competition_id': competition_id, 'season_id': season_id},
+                lambda: sb.matches(
+                    competition_id=competition_id, 
+                    season_id=season_id,
+                    creds=self.creds
+                ),
+                refresh=refresh
             )
-            print(f"{len(matches)} partidos obtenidos")
-            return matches
+            logger.debug("%s partidos obtenidos", len(matches))
+            return self._arrow_strings(self._as_categories(matches, MATCH_CATEGORY_COLUMNS))
             
         except Exception as e:
-            print(f"Error obteniendo partidos: {e}")
+            logger.warning("Error obteniendo partidos: %s", e)
             return pd.DataFrame()
     
     def get_events(self, match_id: int, include_360_metrics: bool = False, 
-                   split: bool = False, flatten_attrs: bool = True) -> pd.DataFrame:
+                   split: bool = False, flatten_attrs: bool = True,
+                   columns: Optional[List[str]] = None,
+                   sink_dir: Optional[Path] = None) -> pd.DataFrame:
         """
         Obtiene los eventos de un partido específico
         
@@ -89,33 +286,203 @@ class StatsBombDataFetcher:
             include_360_metrics: Incluir métricas 360 (solo para clientes con suscripción)
             split: Dividir eventos por tipo en dataframes separados
             flatten_attrs: Aplanar atributos de eventos en columnas separadas
+            columns: Columnas a conservar (opcional, por defecto todas)
+            sink_dir: Directorio donde guardar cada tipo de evento en su propio
+                archivo (solo con split=True; por defecto <caché>/events; se
+                leen con load_events)
         
         Returns:
             DataFrame con los eventos del partido o diccionario de DataFrames si split=True
         """
         try:
-            print(f"Obteniendo eventos del partido {match_id}...")
-            events = sb.events(
-                match_id=match_id, 
-                creds=self.creds, 
-                include_360_metrics=include_360_metrics,
-                split=split,
-                flatten_attrs=flatten_attrs
+            logger.debug("Obteniendo eventos del partido %s...", match_id)
+            downloaded = False
+            
+            def fetch():
+                nonlocal downloaded
+                downloaded = True
+                return sb.events(
+                    match_id=match_id, 
+                    creds=self.creds, 
+                    include_360_metrics=include_360_metrics,
+                    split=split,
+                    flatten_attrs=flatten_attrs
+                )
+            
+            events = self._cached(
+                {'endpoint': 'events', 'match_id': match_id, 'include_360_metrics': include_360_metrics,
+                 'split': split, 'flatten_attrs': flatten_attrs},
+                fetch,
+                fmt='pickle' if split else 'parquet'
             )
             
             if split:
-                print(f"Eventos divididos obtenidos: {list(events.keys())}")
-                for event_type, df in events.items():
-                    print(f"  - {event_type}: {len(df)} eventos")
+                sink_dir = sink_dir or self._events_dir()
+                if sink_dir is not None:
+                    # Se guardan completos para poder leer otras columnas después.
+                    # Si vienen de la caché solo se escriben los tipos que faltan
+                    for event_type, df in events.items():
+                        stem = self._event_stem(sink_dir, match_id, event_type)
+                        if downloaded or not frame_exists(stem):
+                            write_frame(df, stem)
+                
+                events = {
+                    event_type: self._arrow_strings(self._project(df, columns))
+                    for event_type, df in events.items()
+                }
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Eventos divididos obtenidos: %s", list(events.keys()))
+                    for event_type, df in events.items():
+                        logger.debug("  - %s: %s eventos", event_type, len(df))
             else:
-                print(f"{len(events)} eventos obtenidos")
+                events = self._arrow_strings(self._project(events, columns))
+                logger.debug("%s eventos obtenidos", len(events))
             
             return events
             
         except Exception as e:
-            print(f"Error obteniendo eventos del partido {match_id}: {e}")
+            logger.warning("Error obteniendo eventos del partido %s: %s", match_id, e)
             return pd.DataFrame() if not split else {}
     
+    def get_events_batch(self, match_ids: List[int], include_360_metrics: bool = False,
+                         columns: Optional[List[str]] = None) -> Dict[int, pd.DataFrame]:
+        """
+        Obtiene los eventos de varios partidos a la vez
+        
+        Args:
+            match_ids: IDs de los partidos
+            include_360_metrics: Incluir métricas 360 (solo para clientes con suscripción)
+            columns: Columnas a conservar (opcional, por defecto todas)
+        
+        Returns:
+            Diccionario match_id -> DataFrame de eventos (vacío si falló la descarga)
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self._events_batch(match_ids, include_360_metrics, columns))
+        
+        # Ya hay un event loop en curso (ej: Jupyter), donde asyncio.run falla:
+        # mismas descargas en un pool de hilos con la misma concurrencia
+        def fetch(match_id: int):
+            try:
+                return self.get_events(match_id, include_360_metrics=include_360_metrics, columns=columns)
+            except Exception as e:
+                return e
+        
+        if not match_ids:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(EVENTS_CONCURRENCY, len(match_ids))) as executor:
+            results = list(executor.map(fetch, match_ids))
+        return self._collect_events(match_ids, results)
+    
+    async def _events_batch(self, match_ids: List[int], include_360_metrics: bool = False,
+                            columns: Optional[List[str]] = None) -> Dict[int, pd.DataFrame]:
+        """
+        Descarga los eventos de varios partidos en hilos, con un máximo de
+        EVENTS_CONCURRENCY peticiones en curso
+        
+        Args:
+            match_ids: IDs de los partidos
+            include_360_metrics: Incluir métricas 360
+            columns: Columnas a conservar (opcional)
+        
+        Returns:
+            Diccionario match_id -> DataFrame de eventos
+        """
+        semaphore = asyncio.Semaphore(EVENTS_CONCURRENCY)
+        
+        async def fetch(match_id: int) -> pd.DataFrame:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self.get_events, match_id,
+                    include_360_metrics=include_360_metrics, columns=columns
+                )
+        
+        results = await asyncio.gather(*(fetch(match_id) for match_id in match_ids),
+                                       return_exceptions=True)
+        return self._collect_events(match_ids, results)
+    
+    @staticmethod
+    def _collect_events(match_ids: List[int], results: List) -> Dict[int, pd.DataFrame]:
+        """
+        Arma el diccionario de eventos por partido; las descargas que fallaron
+        quedan como DataFrame vacío
+        
+        Args:
+            match_ids: IDs de los partidos
+            results: Resultado (o excepción) de cada descarga, en el mismo orden
+        
+        Returns:
+            Diccionario match_id -> DataFrame de eventos
+        """
+        events = {}
+        for match_id, result in zip(match_ids, results):
+            if isinstance(result, Exception):
+                logger.warning("Error obteniendo eventos del partido %s: %s", match_id, result)
+                result = pd.DataFrame()
+            events[match_id] = result
+        
+        return events
+    
+    def load_events(self, match_id: int, event_types: Optional[List[str]] = None,
+                    columns: Optional[List[str]] = None,
+                    sink_dir: Optional[Path] = None) -> Dict[str, pd.DataFrame]:
+        """
+        Lee de disco los eventos guardados con get_events(split=True, sink_dir=...)
+        
+        Args:
+            match_id: ID del partido
+            event_types: Tipos de evento a leer (ej: ["Shot", "Pass"]; por defecto todos)
+            columns: Columnas a leer (opcional, por defecto todas)
+            sink_dir: Directorio usado al guardar (por defecto <caché>/events)
+        
+        Returns:
+            Diccionario tipo de evento -> DataFrame (vacío si no hay nada guardado)
+        """
+        sink_dir = sink_dir or self._events_dir()
+        if sink_dir is None:
+            return {}
+        
+        match_dir = Path(sink_dir) / f"match_{match_id}"
+        if event_types is None:
+            stems = sorted({path.with_suffix('') for path in match_dir.glob('*.parquet')} |
+                           {path.with_suffix('') for path in match_dir.glob('*.pkl')})
+            names = [None] * len(stems)
+        else:
+            stems = [self._event_stem(sink_dir, match_id, event_type) for event_type in event_types]
+            names = list(event_types)
+        
+        # El nombre original de cada tipo está en la columna 'type' (el archivo usa
+        # uno saneado): se lee siempre para que las llaves no dependan de `columns`
+        read_columns = columns
+        if columns and event_types is None and 'type' not in columns:
+            read_columns = list(columns) + ['type']
+        
+        events = {}
+        for stem, name in zip(stems, names):
+            df = read_frame(stem, read_columns)
+            if df is None:
+                continue
+            if name is None:
+                name = df['type'].iloc[0] if 'type' in df.columns and len(df) else stem.name
+                if read_columns is not columns:
+                    df = df.drop(columns='type', errors='ignore')
+            events[name] = self._arrow_strings(df)
+        
+        logger.debug("Eventos leídos de disco para el partido %s: %s", match_id, list(events.keys()))
+        return events
+    
+    def _events_dir(self) -> Optional[Path]:
+        """Directorio por defecto de los eventos divididos (None si la caché está desactivada)"""
+        return self.cache.cache_dir / "events" if self.cache is not None else None
+    
+    @staticmethod
+    def _event_stem(sink_dir: Path, match_id: int, event_type: str) -> Path:
+        """Ruta sin extensión del archivo de un tipo de evento (ej: 'Ball Receipt*' -> ball_receipt)"""
+        safe_name = re.sub(r'[^0-9a-z]+', '_', event_type.lower()).strip('_')
+        return Path(sink_dir) / f"match_{match_id}" / safe_name
+    
     def get_lineups(self, match_id: int) -> Dict:
         """
         Obtiene las alineaciones de un partido
@@ -127,13 +494,17 @@ class StatsBombDataFetcher:
             Diccionario con las alineaciones
         """
         try:
-            print(f"Obteniendo alineaciones del partido {match_id}...")
-            lineups = sb.lineups(match_id=match_id, creds=self.creds)
-            print(f"Alineaciones obtenidas para {len(lineups)} equipos")
-            return lineups
+            logger.debug("Obteniendo alineaciones del partido %s...", match_id)
+            lineups = self._cached(
+                {'endpoint': 'lineups', 'match_id': match_id},
+                lambda: sb.lineups(match_id=match_id, creds=self.creds),
+                fmt='pickle'
+            )
+            logger.debug("Alineaciones obtenidas para %s equipos", len(lineups))
+            return {team: self._arrow_strings(lineup) for team, lineup in lineups.items()}
             
         except Exception as e:
-            print(f"Error obteniendo alineaciones del partido {match_id}: {e}")
+            logger.warning("Error obteniendo alineaciones del partido %s: %s", match_id, e)
             return {}
     
     def get_frames(self, match_id: int, fmt: str = 'dataframe') -> pd.DataFrame:
@@ -148,120 +519,145 @@ class StatsBombDataFetcher:
             DataFrame o diccionario con los frames 360 del partido
         """
         try:
-            print(f"Obteniendo frames 360 del partido {match_id}...")
-            frames = sb.frames(match_id=match_id, fmt=fmt, creds=self.creds)
+            logger.debug("Obteniendo frames 360 del partido %s...", match_id)
+            frames = self._cached(
+                {'endpoint': 'frames', 'match_id': match_id, 'fmt': fmt},
+                lambda: sb.frames(match_id=match_id, fmt=fmt, creds=self.creds),
+                fmt='parquet' if fmt == 'dataframe' else 'pickle'
+            )
             
             if fmt == 'dataframe':
-                print(f"{len(frames)} frames 360 obtenidos")
+                frames = self._arrow_strings(frames)
+                logger.debug("%s frames 360 obtenidos", len(frames))
             else:
-                print(f"Frames 360 obtenidos en formato diccionario")
+                logger.debug("Frames 360 obtenidos en formato diccionario")
             
             return frames
             
         except Exception as e:
-            print(f"Error obteniendo frames 360 del partido {match_id}: {e}")
+            logger.warning("Error obteniendo frames 360 del partido %s: %s", match_id, e)
             return pd.DataFrame() if fmt == 'dataframe' else {}
         
-    def get_player_season_stats(self, competition_id: int, season_id: int) -> pd.DataFrame:
+    def get_player_season_stats(self, competition_id: int, season_id: int,
+                                columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Obtiene estadísticas de un jugador en una temporada específica
         
         Args:
             competition_id: ID de la competición
             season_id: ID de la temporada
+            columns: Columnas a conservar (opcional, por defecto todas)
         
         Returns:
             DataFrame con las estadísticas del jugador
         """
         try:
-            print(f"Obteniendo estadísticas de los jugadores para (Comp: {competition_id}, Temp: {season_id})...")
-            player_stats = sb.player_season_stats(
-                competition_id=competition_id, 
-                season_id=season_id,
-                creds=self.creds
+            logger.debug("Obteniendo estadísticas de los jugadores para (Comp: %s, Temp: %s)...", competition_id, season_id)
+            player_stats = self._cached(
+                {'endpoint': 'player_season_stats', 'competition_id': competition_id, 'season_id': season_id},
+                lambda: sb.player_season_stats(
+                    competition_id=competition_id, 
+                    season_id=season_id,
+                    creds=self.creds
+                )
             )
-            print(f"Estadísticas de {len(player_stats)} jugadores obtenidas")
-            return player_stats
+            logger.debug("Estadísticas de %s jugadores obtenidas", len(player_stats))
+            return self._arrow_strings(self._project(player_stats, columns))
 
         except Exception as e:
-            print(f"Error obteniendo estadísticas de jugadores: {e}")
+            logger.warning("Error obteniendo estadísticas de jugadores: %s", e)
             return pd.DataFrame()
         
-    def get_player_match_stats(self, match_id: int) -> pd.DataFrame:
+    def get_player_match_stats(self, match_id: int,
+                               columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Obtiene estadísticas de jugadores para un partido específico
         
         Args:
             match_id: ID del partido
+            columns: Columnas a conservar (opcional, por defecto todas)
         
         Returns:
             DataFrame con estadísticas de jugadores del partido
         """
         try:
-            print(f"Obteniendo estadísticas de jugadores del partido {match_id}...")
+            logger.debug("Obteniendo estadísticas de jugadores del partido %s...", match_id)
             
-            player_match_stats = sb.player_match_stats(
-                match_id=match_id,
-                creds=self.creds
+            player_match_stats = self._cached(
+                {'endpoint': 'player_match_stats', 'match_id': match_id},
+                lambda: sb.player_match_stats(
+                    match_id=match_id,
+                    creds=self.creds
+                )
             )
             
-            print(f"Estadísticas de {len(player_match_stats)} jugadores obtenidas")
-            return player_match_stats
+            logger.debug("Estadísticas de %s jugadores obtenidas", len(player_match_stats))
+            return self._arrow_strings(self._project(player_match_stats, columns))
             
         except Exception as e:
-            print(f"Error obteniendo estadísticas de jugadores del partido {match_id}: {e}")
+            logger.warning("Error obteniendo estadísticas de jugadores del partido %s: %s", match_id, e)
             return pd.DataFrame()
         
-    def get_team_season_stats(self, competition_id: int, season_id: int) -> pd.DataFrame:
+    def get_team_season_stats(self, competition_id: int, season_id: int,
+                              columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Obtiene estadísticas de temporada de equipos
         
         Args:
             competition_id: ID de la competición
             season_id: ID de la temporada
+            columns: Columnas a conservar (opcional, por defecto todas)
         
         Returns:
             DataFrame con estadísticas de equipos
         """
         try:
-            print(f"Obteniendo estadísticas de equipos (Comp: {competition_id}, Temp: {season_id})...")
+            logger.debug("Obteniendo estadísticas de equipos (Comp: %s, Temp: %s)...", competition_id, season_id)
             
-            team_stats = sb.team_season_stats(
-                competition_id=competition_id,
-                season_id=season_id,
-                creds=self.creds
+            team_stats = self._cached(
+                {'endpoint': 'team_season_stats', 'competition_id': competition_id, 'season_id': season_id},
+                lambda: sb.team_season_stats(
+                    competition_id=competition_id,
+                    season_id=season_id,
+                    creds=self.creds
+                )
             )
             
-            print(f"Estadísticas de {len(team_stats)} equipos obtenidas")
-            return team_stats
+            logger.debug("Estadísticas de %s equipos obtenidas", len(team_stats))
+            return self._arrow_strings(self._project(team_stats, columns))
             
         except Exception as e:
-            print(f"Error obteniendo estadísticas de equipos: {e}")
+            logger.warning("Error obteniendo estadísticas de equipos: %s", e)
             return pd.DataFrame()
     
-    def get_team_match_stats(self, match_id: int) -> pd.DataFrame:
+    def get_team_match_stats(self, match_id: int,
+                             columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Obtiene estadísticas de equipos para un partido específico
         
         Args:
             match_id: ID del partido
+            columns: Columnas a conservar (opcional, por defecto todas)
         
         Returns:
             DataFrame con estadísticas de equipos del partido
         """
         try:
-            print(f"Obteniendo estadísticas de equipos del partido {match_id}...")
+            logger.debug("Obteniendo estadísticas de equipos del partido %s...", match_id)
             
-            team_match_stats = sb.team_match_stats(
-                match_id=match_id,
-                creds=self.creds
+            team_match_stats = self._cached(
+                {'endpoint': 'team_match_stats', 'match_id': match_id},
+                lambda: sb.team_match_stats(
+                    match_id=match_id,
+                    creds=self.creds
+                )
             )
             
-            print(f"Estadísticas de {len(team_match_stats)} equipos obtenidas")
-            return team_match_stats
+            logger.debug("Estadísticas de %s equipos obtenidas", len(team_match_stats))
+            return self._arrow_strings(self._project(team_match_stats, columns))
             
         except Exception as e:
-            print(f"Error obteniendo estadísticas de equipos del partido {match_id}: {e}")
+            logger.warning("Error obteniendo estadísticas de equipos del partido %s: %s", match_id, e)
             return pd.DataFrame()
     
     def find_club_america_matches(self, competition_id: int, season_id: int) -> pd.DataFrame:
@@ -280,21 +676,13 @@ class StatsBombDataFetcher:
         if matches.empty:
             return pd.DataFrame()
         
-        # Buscar diferentes variaciones del nombre
-        america_variants = ['Club América', 'America', 'CF América', 'Club America']
+        # Buscar diferentes variaciones del nombre sin distinguir mayúsculas
+        # (una sola máscara, sin duplicados)
+        mask = (self._isin_lower(matches['home_team'], _AMERICA_VARIANTS_LOWER) |
+                self._isin_lower(matches['away_team'], _AMERICA_VARIANTS_LOWER))
+        america_matches = matches.loc[mask]
         
-        america_matches = pd.DataFrame()
-        for variant in america_variants:
-            variant_matches = matches[
-                (matches['home_team'] == variant) | 
-                (matches['away_team'] == variant)
-            ]
-            america_matches = pd.concat([america_matches, variant_matches])
-        
-        # Eliminar duplicados
-        america_matches = america_matches.drop_duplicates()
-        
-        print(f"Encontrados {len(america_matches)} partidos del Club América")
+        logger.debug("Encontrados %s partidos del Club América", len(america_matches))
         return america_matches
     
     def get_competitions_raw(self) -> Dict:
@@ -305,13 +693,17 @@ class StatsBombDataFetcher:
             Diccionario con las competiciones
         """
         try:
-            print("Obteniendo competiciones en formato raw...")
-            competitions = sb.competitions(fmt="dict", creds=self.creds)
-            print(f"Competiciones raw obtenidas")
+            logger.debug("Obteniendo competiciones en formato raw...")
+            competitions = self._cached(
+                {'endpoint': 'competitions', 'fmt': 'dict'},
+                lambda: sb.competitions(fmt="dict", creds=self.creds),
+                fmt='pickle'
+            )
+            logger.debug("Competiciones raw obtenidas")
             return competitions
             
         except Exception as e:
-            print(f"Error obteniendo competiciones raw: {e}")
+            logger.warning("Error obteniendo competiciones raw: %s", e)
             return {}
     
     def get_matches_raw(self, competition_id: int, season_id: int) -> Dict:
@@ -326,18 +718,22 @@ class StatsBombDataFetcher:
             Diccionario con los partidos
         """
         try:
-            print(f"Obteniendo partidos raw (Comp: {competition_id}, Temp: {season_id})...")
-            matches = sb.matches(
-                competition_id=competition_id, 
-                season_id=season_id,
-                fmt="dict",
-                creds=self.creds
+            logger.debug("Obteniendo partidos raw (Comp: %s, Temp: %s)...", competition_id, season_id)
+            matches = self._cached(
+                {'endpoint': 'matches', 'competition_id': competition_id, 'season_id': season_id, 'fmt': 'dict'},
+                lambda: sb.matches(
+                    competition_id=competition_id, 
+                    season_id=season_id,
+                    fmt="dict",
+                    creds=self.creds
+                ),
+                fmt='pickle'
             )
-            print(f"Partidos raw obtenidos")
+            logger.debug("Partidos raw obtenidos")
             return matches
             
         except Exception as e:
-            print(f"Error obteniendo partidos raw: {e}")
+            logger.warning("Error obteniendo partidos raw: %s", e)
             return {}
     
     def get_lineups_raw(self, match_id: int) -> Dict:
@@ -351,13 +747,17 @@ class StatsBombDataFetcher:
             Diccionario con las alineaciones
         """
         try:
-            print(f"Obteniendo alineaciones raw del partido {match_id}...")
-            lineups = sb.lineups(match_id=match_id, fmt="dict", creds=self.creds)
-            print(f"Alineaciones raw obtenidas")
+            logger.debug("Obteniendo alineaciones raw del partido %s...", match_id)
+            lineups = self._cached(
+                {'endpoint': 'lineups', 'match_id': match_id, 'fmt': 'dict'},
+                lambda: sb.lineups(match_id=match_id, fmt="dict", creds=self.creds),
+                fmt='pickle'
+            )
+            logger.debug("Alineaciones raw obtenidas")
             return lineups
             
         except Exception as e:
-            print(f"Error obteniendo alineaciones raw: {e}")
+            logger.warning("Error obteniendo alineaciones raw: %s", e)
             return {}
     
     def get_events_raw(self, match_id: int) -> Dict:
@@ -371,13 +771,17 @@ class StatsBombDataFetcher:
             Diccionario con los eventos
         """
         try:
-            print(f"Obteniendo eventos raw del partido {match_id}...")
-            events = sb.events(match_id=match_id, fmt="dict", creds=self.creds)
-            print(f"Eventos raw obtenidos")
+            logger.debug("Obteniendo eventos raw del partido %s...", match_id)
+            events = self._cached(
+                {'endpoint': 'events', 'match_id': match_id, 'fmt': 'dict'},
+                lambda: sb.events(match_id=match_id, fmt="dict", creds=self.creds),
+                fmt='pickle'
+            )
+            logger.debug("Eventos raw obtenidos")
             return events
             
         except Exception as e:
-            print(f"Error obteniendo eventos raw: {e}")
+            logger.warning("Error obteniendo eventos raw: %s", e)
             return {}
     
     def get_frames_raw(self, match_id: int) -> Dict:
@@ -391,13 +795,17 @@ class StatsBombDataFetcher:
             Diccionario con los frames 360
         """
         try:
-            print(f"Obteniendo frames 360 raw del partido {match_id}...")
-            frames = sb.frames(match_id=match_id, fmt="dict", creds=self.creds)
-            print(f"Frames 360 raw obtenidos")
+            logger.debug("Obteniendo frames 360 raw del partido %s...", match_id)
+            frames = self._cached(
+                {'endpoint': 'frames', 'match_id': match_id, 'fmt': 'dict'},
+                lambda: sb.frames(match_id=match_id, fmt="dict", creds=self.creds),
+                fmt='pickle'
+            )
+            logger.debug("Frames 360 raw obtenidos")
             return frames
             
         except Exception as e:
-            print(f"Error obteniendo frames 360 raw: {e}")
+            logger.warning("Error obteniendo frames 360 raw: %s", e)
             return {}
     
     def get_player_match_stats_raw(self, match_id: int) -> Dict:
@@ -411,13 +819,17 @@ class StatsBombDataFetcher:
             Diccionario con estadísticas de jugadores
         """
         try:
-            print(f"Obteniendo estadísticas de jugadores raw del partido {match_id}...")
-            stats = sb.player_match_stats(match_id=match_id, fmt="dict", creds=self.creds)
-            print(f"Estadísticas de jugadores raw obtenidas")
+            logger.debug("Obteniendo estadísticas de jugadores raw del partido %s...", match_id)
+            stats = self._cached(
+                {'endpoint': 'player_match_stats', 'match_id': match_id, 'fmt': 'dict'},
+                lambda: sb.player_match_stats(match_id=match_id, fmt="dict", creds=self.creds),
+                fmt='pickle'
+            )
+            logger.debug("Estadísticas de jugadores raw obtenidas")
             return stats
             
         except Exception as e:
-            print(f"Error obteniendo estadísticas de jugadores raw: {e}")
+            logger.warning("Error obteniendo estadísticas de jugadores raw: %s", e)
             return {}
     
     def get_player_season_stats_raw(self, competition_id: int, season_id: int) -> Dict:
@@ -432,18 +844,23 @@ class StatsBombDataFetcher:
             Diccionario con estadísticas de jugadores
         """
         try:
-            print(f"Obteniendo estadísticas de jugadores raw (Comp: {competition_id}, Temp: {season_id})...")
-            stats = sb.player_season_stats(
-                competition_id=competition_id,
-                season_id=season_id,
-                fmt="dict",
-                creds=self.creds
+            logger.debug("Obteniendo estadísticas de jugadores raw (Comp: %s, Temp: %s)...", competition_id, season_id)
+            stats = self._cached(
+                {'endpoint': 'player_season_stats', 'competition_id': competition_id,
+                 'season_id': season_id, 'fmt': 'dict'},
+                lambda: sb.player_season_stats(
+                    competition_id=competition_id,
+                    season_id=season_id,
+                    fmt="dict",
+                    creds=self.creds
+                ),
+                fmt='pickle'
             )
-            print(f"Estadísticas de jugadores raw obtenidas")
+            logger.debug("Estadísticas de jugadores raw obtenidas")
             return stats
             
         except Exception as e:
-            print(f"Error obteniendo estadísticas de jugadores raw: {e}")
+            logger.warning("Error obteniendo estadísticas de jugadores raw: %s", e)
             return {}
     
     def get_team_match_stats_raw(self, match_id: int) -> Dict:
@@ -457,13 +874,17 @@ class StatsBombDataFetcher:
             Diccionario con estadísticas de equipos
         """
         try:
-            print(f"Obteniendo estadísticas de equipos raw del partido {match_id}...")
-            stats = sb.team_match_stats(match_id=match_id, fmt="dict", creds=self.creds)
-            print(f"Estadísticas de equipos raw obtenidas")
+            logger.debug("Obteniendo estadísticas de equipos raw del partido %s...", match_id)
+            stats = self._cached(
+                {'endpoint': 'team_match_stats', 'match_id': match_id, 'fmt': 'dict'},
+                lambda: sb.team_match_stats(match_id=match_id, fmt="dict", creds=self.creds),
+                fmt='pickle'
+            )
+            logger.debug("Estadísticas de equipos raw obtenidas")
             return stats
             
         except Exception as e:
-            print(f"Error obteniendo estadísticas de equipos raw: {e}")
+            logger.warning("Error obteniendo estadísticas de equipos raw: %s", e)
             return {}
     
     def get_team_season_stats_raw(self, competition_id: int, season_id: int) -> Dict:
@@ -478,18 +899,23 @@ class StatsBombDataFetcher:
             Diccionario con estadísticas de equipos
         """
         try:
-            print(f"Obteniendo estadísticas de equipos raw (Comp: {competition_id}, Temp: {season_id})...")
-            stats = sb.team_season_stats(
-                competition_id=competition_id,
-                season_id=season_id,
-                fmt="dict",
-                creds=self.creds
+            logger.debug("Obteniendo estadísticas de equipos raw (Comp: %s, Temp: %s)...", competition_id, season_id)
+            stats = self._cached(
+                {'endpoint': 'team_season_stats', 'competition_id': competition_id,
+                 'season_id': season_id, 'fmt': 'dict'},
+                lambda: sb.team_season_stats(
+                    competition_id=competition_id,
+                    season_id=season_id,
+                    fmt="dict",
+                    creds=self.creds
+                ),
+                fmt='pickle'
             )
-            print(f"Estadísticas de equipos raw obtenidas")
+            logger.debug("Estadísticas de equipos raw obtenidas")
             return stats
             
         except Exception as e:
-            print(f"Error obteniendo estadísticas de equipos raw: {e}")
+            logger.warning("Error obteniendo estadísticas de equipos raw: %s", e)
             return {}
     
     def get_sample_data(self) -> Dict:
@@ -499,7 +925,7 @@ class StatsBombDataFetcher:
         Returns:
             Diccionario con datos de muestra
         """
-        print("Obteniendo datos de muestra...")
+        logger.debug("Obteniendo datos de muestra...")
         
         sample_data = {
             'competitions': pd.DataFrame(),
@@ -519,27 +945,28 @@ class StatsBombDataFetcher:
                 comp_id = first_comp['competition_id']
                 season_id = first_comp['season_id']
                 
-                print(f"Usando: {first_comp['competition_name']} - {first_comp['season_name']}")
+                logger.debug("Usando: %s - %s", first_comp['competition_name'], first_comp['season_name'])
                 
                 # Obtener partidos
                 matches = self.get_matches(comp_id, season_id)
                 sample_data['matches'] = matches.head(5)  # Solo 5 partidos para muestra
                 
                 if not matches.empty:
-                    # Obtener eventos del primer partido
+                    # Eventos y alineaciones del primer partido se piden en paralelo
                     first_match_id = matches.iloc[0]['match_id']
-                    events = self.get_events(first_match_id, include_360_metrics=True)
-                    sample_data['events'] = events.head(100)  # Primeros 100 eventos
+                    with ThreadPoolExecutor(max_workers=2) as executor:
+                        fut_events = executor.submit(self.get_events, first_match_id, include_360_metrics=True)
+                        fut_lineups = executor.submit(self.get_lineups, first_match_id)
+                        events, lineups = fut_events.result(), fut_lineups.result()
                     
-                    # Obtener alineaciones del primer partido
-                    lineups = self.get_lineups(first_match_id)
+                    sample_data['events'] = events.head(100)  # Primeros 100 eventos
                     sample_data['lineups'] = lineups
             
-            print("Datos de muestra obtenidos correctamente")
+            logger.debug("Datos de muestra obtenidos correctamente")
             return sample_data
             
         except Exception as e:
-            print(f"Error obteniendo datos de muestra: {e}")
+            logger.warning("Error obteniendo datos de muestra: %s", e)
             return sample_data
     
     def get_competition_info(self, competition_id: int, season_id: int) -> Dict:
@@ -563,11 +990,11 @@ class StatsBombDataFetcher:
             if not comp_info.empty:
                 return comp_info.iloc[0].to_dict()
             else:
-                print(f"No se encontró la competición {competition_id} - {season_id}")
+                logger.warning("No se encontró la competición %s - %s", competition_id, season_id)
                 return {}
                 
         except Exception as e:
-            print(f"Error obteniendo información de competición: {e}")
+            logger.warning("Error obteniendo información de competición: %s", e)
             return {}
     
     def get_match_info(self, match_id: int) -> Dict:
@@ -581,26 +1008,112 @@ class StatsBombDataFetcher:
             Diccionario con información del partido
         """
         try:
-            # Primero necesitamos encontrar en qué competición está el partido
-            competitions = self.get_competitions()
+            # Tabla ya existente (en memoria de una llamada anterior o en disco);
+            # si no, la primera búsqueda la construye y no hace falta repetirla
+            existing_table = self._all_matches is not None or self._all_matches_on_disk()
+            match_info = self._lookup_match(match_id)
             
-            for _, comp in competitions.iterrows():
-                matches = self.get_matches(comp['competition_id'], comp['season_id'])
-                match_info = matches[matches['match_id'] == match_id]
-                
-                if not match_info.empty:
-                    match_data = match_info.iloc[0].to_dict()
-                    match_data['competition_name'] = comp['competition_name']
-                    match_data['season_name'] = comp['season_name']
-                    return match_data
+            if match_info.empty and existing_table:
+                # La tabla puede estar desactualizada: se reconstruye una vez con
+                # datos recién descargados (la caché en disco tendría los mismos partidos)
+                match_info = self._lookup_match(match_id, rebuild=True)
             
-            print(f"No se encontró el partido {match_id}")
-            return {}
+            if match_info.empty:
+                logger.warning("No se encontró el partido %s", match_id)
+                return {}
+            
+            return match_info.iloc[0].to_dict()
             
         except Exception as e:
-            print(f"Error obteniendo información del partido: {e}")
+            logger.warning("Error obteniendo información del partido: %s", e)
             return {}
     
+    def _build_all_matches(self, refresh: bool = False) -> pd.DataFrame:
+        """
+        Construye la tabla con los partidos de todas las competiciones, con los
+        nombres de competición y temporada, y la guarda en disco particionada
+        por competition_id y season_id
+        
+        Args:
+            refresh: Descargar competiciones y partidos ignorando la caché en disco
+        
+        Returns:
+            DataFrame con todos los partidos
+        """
+        competitions = self._raw_competitions(refresh=refresh)
+        all_matches = self._fetch_many(self.get_matches, [
+            {'competition_id': competition_id, 'season_id': season_id, 'refresh': refresh}
+            for competition_id, season_id in competitions[['competition_id', 'season_id']].itertuples(index=False, name=None)
+        ])
+        
+        parts = [
+            matches.assign(
+                competition_id=competition_id,
+                season_id=season_id,
+                competition_name=competition_name,
+                season_name=season_name
+            )
+            for (competition_id, season_id, competition_name, season_name), matches in zip(
+                competitions[MATCH_INDEX_COLUMNS[1:]].itertuples(index=False, name=None), all_matches
+            )
+            if not matches.empty
+        ]
+        
+        if not parts:
+            return pd.DataFrame(columns=MATCH_INDEX_COLUMNS)
+        
+        # El índice no se usa (se filtra por posición), no hace falta renumerarlo
+        table = pd.concat(parts)
+        
+        table_path = self._all_matches_path()
+        if table_path is not None:
+            # Se escribe en un directorio temporal y se reemplaza el anterior
+            tmp_path = table_path.with_name(f"{table_path.name}.{uuid.uuid4().hex}.tmp")
+            try:
+                table.to_parquet(tmp_path, partition_cols=['competition_id', 'season_id'],
+                                 index=False, compression='zstd')
+                shutil.rmtree(table_path, ignore_errors=True)
+                os.replace(tmp_path, table_path)
+            except Exception as e:
+                shutil.rmtree(tmp_path, ignore_errors=True)
+                logger.warning("No se pudo guardar la tabla de partidos: %s", e)
+        
+        logger.debug("Tabla de partidos construida: %s partidos", len(table))
+        return table
+    
+    def _all_matches_path(self) -> Optional[Path]:
+        """Ruta de la tabla de partidos (None si la caché está desactivada)"""
+        return self.cache.cache_dir / "all_matches.parquet" if self.cache is not None else None
+    
+    def _all_matches_on_disk(self) -> bool:
+        """Indica si se puede leer la tabla de partidos guardada en disco"""
+        table_path = self._all_matches_path()
+        return table_path is not None and table_path.exists() and not self.force_refresh
+    
+    def _lookup_match(self, match_id: int, rebuild: bool = False) -> pd.DataFrame:
+        """
+        Busca un partido en la tabla de partidos. Si la tabla está en disco se
+        lee solo la fila del partido (filtro aplicado por Parquet)
+        
+        Args:
+            match_id: ID del partido
+            rebuild: Reconstruir la tabla desde la API (sin la caché en disco)
+                antes de buscar
+        
+        Returns:
+            DataFrame con la fila del partido (vacío si no existe)
+        """
+        if rebuild or (self._all_matches is None and not self._all_matches_on_disk()):
+            self._all_matches = self._build_all_matches(refresh=rebuild)
+        
+        if self._all_matches is not None:
+            return self._all_matches[self._all_matches['match_id'].to_numpy() == match_id]
+        
+        match_row = pd.read_parquet(self._all_matches_path(), filters=[('match_id', '==', int(match_id))])
+        # Las columnas de partición vuelven como categóricas
+        match_row = match_row.astype({'competition_id': 'int64', 'season_id': 'int64'})
+        return self._arrow_strings(match_row)
+    
     def search_team_matches(self, team_name: str, competition_id: int = None, 
                            season_id: int = None) -> pd.DataFrame:
         """
@@ -620,29 +1133,32 @@ class StatsBombDataFetcher:
             else:
                 # Buscar en todas las competiciones disponibles
                 competitions = self.get_competitions()
-                all_matches = []
-                
-                for _, comp in competitions.iterrows():
-                    comp_matches = self.get_matches(comp['competition_id'], comp['season_id'])
-                    if not comp_matches.empty:
-                        all_matches.append(comp_matches)
+                all_matches = [
+                    comp_matches for comp_matches in self._fetch_many(self.get_matches, [
+                        {'competition_id': competition_id, 'season_id': season_id}
+                        for competition_id, season_id in competitions[['competition_id', 'season_id']].itertuples(index=False, name=None)
+                    ])
+                    if not comp_matches.empty
+                ]
                 
                 if all_matches:
                     matches = pd.concat(all_matches, ignore_index=True)
                 else:
                     return pd.DataFrame()
             
-            # Buscar partidos del equipo
+            # Buscar partidos del equipo (subcadena sin distinguir mayúsculas, sin regex)
+            needle = team_name.lower()
+            # Máscara NumPy: las dos columnas se combinan sin alinear índices
             team_matches = matches[
-                (matches['home_team'].str.contains(team_name, case=False, na=False)) |
-                (matches['away_team'].str.contains(team_name, case=False, na=False))
+                self._contains_lower(matches['home_team'], needle).to_numpy() |
+                self._contains_lower(matches['away_team'], needle).to_numpy()
             ]
             
-            print(f"Encontrados {len(team_matches)} partidos para {team_name}")
+            logger.debug("Encontrados %s partidos para %s", len(team_matches), team_name)
             return team_matches
             
         except Exception as e:
-            print(f"Error buscando partidos del equipo {team_name}: {e}")
+            logger.warning("Error buscando partidos del equipo %s: %s", team_name, e)
             return pd.DataFrame()
     
     def get_available_data_summary(self) -> Dict:
@@ -653,7 +1169,7 @@ class StatsBombDataFetcher:
             Diccionario con resumen de datos disponibles
         """
         try:
-            print("Generando resumen de datos disponibles...")
+            logger.debug("Generando resumen de datos disponibles...")
             
             competitions = self.get_competitions()
             summary = {
@@ -664,17 +1180,32 @@ class StatsBombDataFetcher:
                 'genders': competitions['competition_gender'].unique().tolist() if not competitions.empty else []
             }
             
+            if competitions.empty:
+                summary['total_matches'] = 0
+                summary['matches_per_competition'] = {}
+                return summary
+            
             # Contar partidos totales
-            total_matches = 0
-            for _, comp in competitions.iterrows():
-                matches = self.get_matches(comp['competition_id'], comp['season_id'])
-                total_matches += len(matches)
+            all_matches = self._fetch_many(self.get_matches, [
+                {'competition_id': competition_id, 'season_id': season_id}
+                for competition_id, season_id in competitions[['competition_id', 'season_id']].itertuples(index=False, name=None)
+            ])
             
-            summary['total_matches'] = total_matches
+            # Un conteo por (competición, temporada) agregado en una sola pasada,
+            # sin concatenar los partidos
+            match_counts = pd.Series(
+                np.fromiter((len(matches) for matches in all_matches), dtype=np.int64, count=len(all_matches)),
+                index=competitions['competition_id'].to_numpy()
+            )
+            summary['total_matches'] = int(match_counts.sum())
+            summary['matches_per_competition'] = {
+                int(competition_id): int(total)
+                for competition_id, total in match_counts.groupby(level=0).sum().items()
+            }
             
-            print(f"Resumen generado: {summary['total_competitions']} competiciones, {summary['total_matches']} partidos")
+            logger.debug("Resumen generado: %s competiciones, %s partidos", summary['total_competitions'], summary['total_matches'])
             return summary
             
         except Exception as e:
-            print(f"Error generando resumen: {e}")
+            logger.warning("Error generando resumen: %s", e)
             return {}
\ No newline at end of file
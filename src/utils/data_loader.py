@@ -1,31 +1,65 @@
 """Utilidades para carga de datos"""
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import Optional
-from src.config import PLAYERS_DATA
+from typing import List, Optional
+from src.config import NORMALIZED_FEATURES, PLAYERS_DATA
 
 class DataLoader:
     """Clase para cargar y filtrar datos de jugadores"""
     
-    def __init__(self, data_path: Optional[Path] = None):
+    def __init__(self, data_path: Optional[Path] = None, columns: Optional[List[str]] = None):
         """
         Inicializa el cargador de datos
         
         Args:
             data_path: Ruta al CSV de jugadores (opcional)
+            columns: Columnas a cargar (opcional, por defecto todas)
         """
-        self.data_path = data_path or PLAYERS_DATA
+        self.data_path = Path(data_path or PLAYERS_DATA)
+        self.columns = columns
         self._df = None
     
     @property
     def df(self) -> pd.DataFrame:
         """Carga los datos solo cuando se necesitan (lazy loading)"""
         if self._df is None:
-            print(f"Cargando datos desde: {self.data_path}")
-            self._df = pd.read_csv(self.data_path)
+            source = self._source_path()
+            print(f"Cargando datos desde: {source}")
+            
+            if source.suffix == '.parquet':
+                df = pd.read_parquet(source, columns=self.columns, use_threads=True)
+            else:
+                # Lector multihilo de Arrow
+                df = pd.read_csv(source, engine='pyarrow', usecols=self.columns)
+            
+            # El texto queda en string[pyarrow] y las métricas numéricas en NumPy
+            # (las usan scikit-learn y NumPy)
+            text_cols = df.select_dtypes(include='object').columns
+            dtypes = {col: 'string[pyarrow]' for col in text_cols}
+            # Las features normalizadas (radar y similitud) en float32: la mitad de
+            # memoria y de tráfico sin perder precisión útil
+            dtypes.update({col: np.float32 for col in NORMALIZED_FEATURES if col in df.columns})
+            self._df = df.astype(dtypes)
             print(f"Cargados {len(self._df)} registros")
         return self._df
     
+    def _source_path(self) -> Path:
+        """
+        Elige el archivo a leer: la copia Parquet que guarda DataProcessor junto
+        al CSV si existe y no es más antigua que el CSV
+        
+        Returns:
+            Ruta del Parquet o del CSV
+        """
+        parquet_path = self.data_path.with_suffix('.parquet')
+        if parquet_path.exists() and (
+            not self.data_path.exists()
+            or parquet_path.stat().st_mtime >= self.data_path.stat().st_mtime
+        ):
+            return parquet_path
+        return self.data_path
+    
     def get_players(
         self,
         position: Optional[str] = None,
@@ -41,7 +75,9 @@ class DataLoader:
         Returns:
             DataFrame filtrado
         """
-        df = self.df.copy()
+        # Los filtros ya devuelven un DataFrame nuevo; sin filtros se copia al final
+        # para que quien modifique el resultado no altere los datos cargados
+        df = self.df
         
         # Filtrar por minutos
         if min_minutes > 0:
@@ -51,7 +87,7 @@ class DataLoader:
         if position:
             df = df[df['position_category'] == position]
         
-        return df
+        return df.copy() if df is self.df else df
     
     def get_player_by_name(self, player_name: str) -> pd.DataFrame:
         """
@@ -63,7 +99,7 @@ class DataLoader:
         Returns:
             DataFrame con jugadores que coinciden
         """
-        df = self.df.copy()
+        df = self.df
         mask = df['player_name'].str.contains(player_name, case=False, na=False)
         return df[mask]
     
@@ -75,10 +111,12 @@ class DataLoader:
             Diccionario con estadísticas básicas
         """
         df = self.df
+        positions = df['position_category'].value_counts()
         return {
             'total_players': len(df),
             'total_teams': df['team_name'].nunique(),
             'total_seasons': df['season_name'].nunique(),
-            'positions': df['position_category'].value_counts().to_dict(),
+            # Con columnas categóricas value_counts incluye categorías vacías
+            'positions': positions[positions > 0].to_dict(),
             'avg_minutes': round(df['player_season_minutes'].mean(), 1)
         }
\ No newline at end of file
@@ -2,23 +2,145 @@
 Data processing module for player statistics extraction and normalization
 Extracted from notebooks/procesamiento_datos.ipynb
 """
+import functools
 import pandas as pd
 import numpy as np
 from typing import List, Tuple, Dict, Optional
 from pathlib import Path
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 warnings.filterwarnings('ignore')
 
 from src.utils.data_fetcher import StatsBombDataFetcher
+from src.utils.cache import DEFAULT_CACHE_DIR, DiskCache, memoize_frame
+
+# Categorías de posición (orden fijo de los códigos del Categorical)
+POSITION_CATEGORIES = ['GK', 'DEF', 'MED', 'FWD']
+
+# Vida de los resultados memorizados de procesamiento (30 días). Las entradas
+# de código o datos anteriores ya no se consultan, así que se borran al vencer
+PROCESSING_MEMO_MAX_AGE = 30 * 24 * 60 * 60
+
+# Opciones de escritura Parquet: zstd, grupos de filas pequeños y estadísticas
+# para que las lecturas de pocas columnas o con filtros salten datos
+PARQUET_OPTIONS = {
+    'engine': 'pyarrow',
+    'compression': 'zstd',
+    'compression_level': 3,
+    'row_group_size': 50_000,
+    'use_dictionary': True,
+    'write_statistics': True,
+    'index': False,
+}
+
+# Métricas básicas
+BASE_METRICS = (
+    'account_id', 'player_id', 'player_name', 'team_id', 'team_name',
+    'season_id', 'season_name', 'country_id', 'player_season_minutes',
+    'primary_position_id', 'primary_position',
+)
+
+# Métricas ofensivas (por 90 minutos)
+OFFENSIVE_METRICS = (
+    'player_season_goals_90',
+    'player_season_assists_90',
+    'player_season_np_xg_90',
+    'player_season_xag_90',
+    'player_season_np_shots_90',
+    'player_season_np_xg_per_shot',
+    'player_season_shot_touch_ratio',
+    'player_season_dribbles_90',
+    'player_season_dribble_ratio',
+)
+
+# Métricas de pases y creación
+PASSING_METRICS = (
+    'player_season_passes_into_box_90',
+    'player_season_cross_completion_ratio',
+    'player_season_deep_completions_90',
+    'player_season_key_passes_90',
+    'player_season_pass_completion_ratio',
+    'player_season_progressive_passes_90',
+    'player_season_obv_pass_90',
+)
+
+# Métricas defensivas
+DEFENSIVE_METRICS = (
+    'player_season_pressures_90',
+    'player_season_pressure_regains_90',
+    'player_season_tackles_90',
+    'player_season_interceptions_90',
+    'player_season_blocks_90',
+    'player_season_clearances_90',
+    'player_season_defensive_actions_90',
+    'player_season_aerial_ratio',
+)
+
+# Métricas de portero
+GK_METRICS = (
+    'player_season_psxg_conceded',
+    'player_season_save_ratio',
+    'player_season_clean_sheet_ratio',
+)
+
+# Métricas avanzadas (OBV, xG)
+ADVANCED_METRICS = (
+    'player_season_obv_90',
+    'player_season_obv_dribble_carry_90',
+    'player_season_obv_defensive_action_90',
+    'player_season_obv_shot_90',
+)
+
+# Todas las métricas en orden y sin duplicados
+ALL_METRICS = tuple(dict.fromkeys(
+    BASE_METRICS + OFFENSIVE_METRICS + PASSING_METRICS +
+    DEFENSIVE_METRICS + GK_METRICS + ADVANCED_METRICS
+))
 
 
 class DataProcessor:
     """Main data processing class for player statistics ETL pipeline"""
     
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
+        """
+        Args:
+            use_cache: Reutilizar en disco los resultados de las etapas de
+                procesamiento cuando la entrada y el código no cambian
+        """
         self.fetcher = StatsBombDataFetcher()
-        self.processed_data = None
+        self.memo = None
+        if use_cache:
+            self.memo = DiskCache(DEFAULT_CACHE_DIR / 'processing', max_age=PROCESSING_MEMO_MAX_AGE)
+            self.memo.prune()
+        self._processed_data = None
+        self._america_players = None
+    
+    @property
+    def processed_data(self) -> Optional[pd.DataFrame]:
+        """Dataset consolidado de todas las temporadas"""
+        return self._processed_data
+    
+    @processed_data.setter
+    def processed_data(self, value: Optional[pd.DataFrame]):
+        # Datos nuevos: el subconjunto del América guardado deja de ser válido
+        self._processed_data = value
+        self._america_players = None
+        
+    @classmethod
+    @functools.lru_cache(maxsize=8)
+    def _available_metrics(cls, columns: frozenset) -> Tuple[str, ...]:
+        """
+        Métricas de ALL_METRICS presentes en un esquema de columnas
         
+        Args:
+            columns: Columnas del DataFrame de entrada
+            
+        Returns:
+            Tupla con las métricas disponibles, en el orden de ALL_METRICS
+        """
+        return tuple(col for col in ALL_METRICS if col in columns)
+    
+    @memoize_frame(depends=(ALL_METRICS, _available_metrics))
     def extract_player_key_metrics(self, player_season_df: pd.DataFrame) -> pd.DataFrame:
         """
         Extrae y calcula métricas clave de jugadores para el sistema de recomendación.
@@ -30,87 +152,28 @@ class DataProcessor:
             DataFrame con métricas procesadas y normalizadas
         """
         
+        # Quedarse con las métricas que existen (el esquema se repite entre temporadas)
+        available_metrics = list(self._available_metrics(frozenset(player_season_df.columns)))
+        
         # Filtrar jugadores con minutos mínimos (al menos 450 minutos = ~5 partidos completos)
-        df = player_season_df[player_season_df['player_season_minutes'] >= 450].copy()
-        
-        # Métricas básicas
-        base_metrics = [
-            'account_id', 'player_id', 'player_name', 'team_id', 'team_name',
-            'season_id', 'season_name', 'country_id', 'player_season_minutes',
-            'primary_position_id', 'primary_position'
-        ]
-        
-        # Métricas ofensivas (por 90 minutos)
-        offensive_metrics = [
-            'player_season_goals_90',
-            'player_season_assists_90',
-            'player_season_np_xg_90',
-            'player_season_xag_90',
-            'player_season_np_shots_90',
-            'player_season_np_xg_per_shot',
-            'player_season_shot_touch_ratio',
-            'player_season_dribbles_90',
-            'player_season_dribble_ratio'
-        ]
-        
-        # Métricas de pases y creación
-        passing_metrics = [
-            'player_season_passes_into_box_90',
-            'player_season_cross_completion_ratio',
-            'player_season_deep_completions_90',
-            'player_season_key_passes_90',
-            'player_season_pass_completion_ratio',
-            'player_season_progressive_passes_90',
-            'player_season_obv_pass_90'
-        ]
-        
-        # Métricas defensivas
-        defensive_metrics = [
-            'player_season_pressures_90',
-            'player_season_pressure_regains_90',
-            'player_season_tackles_90',
-            'player_season_interceptions_90',
-            'player_season_blocks_90',
-            'player_season_clearances_90',
-            'player_season_defensive_actions_90',
-            'player_season_aerial_ratio'
-        ]
-        
-        # Métricas de portero
-        gk_metrics = [
-            'player_season_psxg_conceded',
-            'player_season_save_ratio',
-            'player_season_clean_sheet_ratio'
-        ]
-        
-        # Métricas avanzadas (OBV, xG)
-        advanced_metrics = [
-            'player_season_obv_90',
-            'player_season_obv_dribble_carry_90',
-            'player_season_obv_defensive_action_90',
-            'player_season_obv_shot_90'
-        ]
-        
-        # Combinar todas las métricas disponibles
-        all_metrics = base_metrics.copy()
-        
-        # Agregar solo las métricas que existen en el DataFrame
-        for metric_list in [offensive_metrics, passing_metrics, defensive_metrics, 
-                            gk_metrics, advanced_metrics]:
-            for metric in metric_list:
-                if metric in df.columns:
-                    all_metrics.append(metric)
-        
-        # Seleccionar columnas disponibles
-        available_metrics = [col for col in all_metrics if col in df.columns]
-        df_processed = df[available_metrics].copy()
-        
-        # Rellenar NaN con 0 para métricas numéricas
-        numeric_cols = df_processed.select_dtypes(include=[np.number]).columns
-        df_processed[numeric_cols] = df_processed[numeric_cols].fillna(0)
+        # y seleccionar columnas en un solo paso. La selección ya es un objeto nuevo;
+        # la copia superficial solo lo desliga de la entrada sin duplicar datos
+        min_minutes_mask = player_season_df['player_season_minutes'] >= 450
+        df_processed = player_season_df.loc[min_minutes_mask, available_metrics].copy(deep=False)
+        
+        # Rellenar NaN con 0 para métricas numéricas (solo las flotantes pueden
+        # tener NaN): una pasada de NumPy sobre un único bloque, sin tocar los infinitos.
+        # Las métricas se guardan en float32 (sobra precisión para tasas por 90 y
+        # minutos, que no son enteros) para reducir memoria y el costo de la normalización
+        float_cols = df_processed.select_dtypes(include=['floating']).columns
+        if len(float_cols) > 0:
+            values = df_processed[float_cols].to_numpy(dtype=np.float32)
+            np.nan_to_num(values, copy=False, nan=0.0, posinf=np.inf, neginf=-np.inf)
+            df_processed[float_cols] = values
         
         return df_processed
     
+    @memoize_frame(depends=(POSITION_CATEGORIES,))
     def classify_player_position(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Clasifica jugadores en categorías de posición amplias.
@@ -122,7 +185,8 @@ class DataProcessor:
             DataFrame con columna adicional 'position_category'
         """
         
-        df = df.copy()
+        # Copia superficial: solo se agrega una columna, la entrada no se modifica
+        df = df.copy(deep=False)
         
         # Mapeo de posiciones a categorías
         position_mapping = {
@@ -161,11 +225,22 @@ class DataProcessor:
         }
         
         if 'primary_position' in df.columns:
-            df['position_category'] = df['primary_position'].map(position_mapping)
-            df['position_category'] = df['position_category'].fillna('MED')  # Default a mediocampo
+            # Se traduce cada posición distinta una sola vez y luego se indexa por código.
+            # El último elemento de la tabla atiende el código -1 (posición faltante).
+            positions = pd.Categorical(df['primary_position'])
+            default_code = POSITION_CATEGORIES.index('MED')  # Default a mediocampo
+            lookup = np.array(
+                [POSITION_CATEGORIES.index(position_mapping.get(position, 'MED')) for position in positions.categories]
+                + [default_code],
+                dtype=np.int8
+            )
+            df['position_category'] = pd.Categorical.from_codes(
+                lookup[positions.codes], categories=POSITION_CATEGORIES
+            )
         
         return df
     
+    @memoize_frame
     def normalize_metrics_by_position(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Normaliza métricas usando z-score dentro de cada categoría de posición.
@@ -178,19 +253,21 @@ class DataProcessor:
             DataFrame con métricas normalizadas (sufijo _norm)
         """
         
-        df = df.copy()
-        
         # Identificar columnas numéricas que terminan en _90
         metric_cols = [col for col in df.columns if col.endswith('_90') or col.endswith('_ratio')]
         
         # Normalizar por posición
-        if 'position_category' in df.columns:
-            for metric in metric_cols:
-                if metric in df.columns:
-                    # Calcular z-score por posición
-                    df[f'{metric}_norm'] = df.groupby('position_category')[metric].transform(
-                        lambda x: (x - x.mean()) / x.std() if x.std() > 0 else 0
-                    )
+        if 'position_category' in df.columns and metric_cols:
+            # Media y desviación de cada posición para todas las métricas a la vez
+            grouped = df.groupby('position_category', observed=True)[metric_cols]
+            means = grouped.transform('mean')
+            stds = grouped.transform('std')
+            
+            # z-score por posición (0 si la métrica no varía dentro de la posición)
+            norm = ((df[metric_cols] - means) / stds).where(stds > 0, 0.0)
+            norm.columns = [f'{metric}_norm' for metric in metric_cols]
+            
+            df = pd.concat([df.drop(columns=norm.columns, errors='ignore'), norm], axis=1)
         
         return df
     
@@ -208,37 +285,45 @@ class DataProcessor:
         """
         all_seasons_data = []
         
-        for season_id, season_name in seasons:
-            print(f"\n{'=' * 60}")
-            print(f"Procesando temporada: {season_name}")
-            print('=' * 60)
-            
-            # Obtener datos de jugadores
-            player_data = self.fetcher.get_player_season_stats(competition_id, season_id)
-            
-            if player_data.empty:
-                print(f"No hay datos para {season_name}")
-                continue
-            
-            print(f"{len(player_data)} jugadores encontrados")
+        # Se piden todas las temporadas a la vez; mientras se procesa una, las
+        # siguientes se siguen descargando. Se procesan en el orden recibido.
+        with ThreadPoolExecutor(max_workers=max(1, min(len(seasons), 8))) as executor:
+            futures = [
+                executor.submit(self.fetcher.get_player_season_stats, competition_id, season_id)
+                for season_id, _ in seasons
+            ]
             
-            # Extraer métricas clave
-            processed_data = self.extract_player_key_metrics(player_data)
-            print(f"Métricas extraídas: {len(processed_data)} jugadores con minutos suficientes")
-            
-            # Clasificar por posición
-            processed_data = self.classify_player_position(processed_data)
-            
-            # Normalizar métricas
-            processed_data = self.normalize_metrics_by_position(processed_data)
-            
-            print(f"Datos procesados y normalizados")
-            print(f"   - Porteros: {len(processed_data[processed_data['position_category'] == 'GK'])}")
-            print(f"   - Defensas: {len(processed_data[processed_data['position_category'] == 'DEF'])}")
-            print(f"   - Mediocampistas: {len(processed_data[processed_data['position_category'] == 'MED'])}")
-            print(f"   - Delanteros: {len(processed_data[processed_data['position_category'] == 'FWD'])}")
-            
-            all_seasons_data.append(processed_data)
+            for (season_id, season_name), future in zip(seasons, futures):
+                print(f"\n{'=' * 60}")
+                print(f"Procesando temporada: {season_name}")
+                print('=' * 60)
+                
+                # Obtener datos de jugadores
+                player_data = future.result()
+                
+                if player_data.empty:
+                    print(f"No hay datos para {season_name}")
+                    continue
+                
+                print(f"{len(player_data)} jugadores encontrados")
+                
+                # Extraer métricas clave
+                processed_data = self.extract_player_key_metrics(player_data)
+                print(f"Métricas extraídas: {len(processed_data)} jugadores con minutos suficientes")
+                
+                # Clasificar por posición
+                processed_data = self.classify_player_position(processed_data)
+                
+                # Normalizar métricas
+                processed_data = self.normalize_metrics_by_position(processed_data)
+                
+                print(f"Datos procesados y normalizados")
+                print(f"   - Porteros: {len(processed_data[processed_data['position_category'] == 'GK'])}")
+                print(f"   - Defensas: {len(processed_data[processed_data['position_category'] == 'DEF'])}")
+                print(f"   - Mediocampistas: {len(processed_data[processed_data['position_category'] == 'MED'])}")
+                print(f"   - Delanteros: {len(processed_data[processed_data['position_category'] == 'FWD'])}")
+                
+                all_seasons_data.append(processed_data)
         
         # Combinar todas las temporadas
         print(f"\n{'=' * 60}")
@@ -246,7 +331,11 @@ class DataProcessor:
         print('=' * 60)
         
         if all_seasons_data:
-            df_all_players = pd.concat(all_seasons_data, ignore_index=True)
+            # Una sola concatenación, sin reordenar columnas
+            df_all_players = pd.concat(all_seasons_data, ignore_index=True, sort=False)
+            
+            # Pocos equipos distintos: categórica para comparar códigos en lugar de textos
+            df_all_players['team_name'] = df_all_players['team_name'].astype('category')
             print(f"Total de registros: {len(df_all_players)}")
             print(f"Jugadores únicos: {df_all_players['player_id'].nunique()}")
             print(f"Equipos únicos: {df_all_players['team_name'].nunique()}")
@@ -257,9 +346,13 @@ class DataProcessor:
             print("No se procesaron datos")
             return pd.DataFrame()
     
-    def get_america_players(self) -> pd.DataFrame:
+    def get_america_players(self, verbose: bool = True) -> pd.DataFrame:
         """
-        Extrae jugadores del Club América del dataset procesado
+        Extrae jugadores del Club América del dataset procesado.
+        El resultado se calcula una vez por cada processed_data.
+        
+        Args:
+            verbose: Imprimir el resumen por temporada y posición
         
         Returns:
             DataFrame con jugadores del América
@@ -267,9 +360,13 @@ class DataProcessor:
         if self.processed_data is None:
             raise ValueError("No hay datos procesados. Ejecuta process_seasons_data() primero.")
         
-        america_players = self.processed_data[
-            self.processed_data['team_name'].str.contains('América', case=False, na=False)
-        ].copy()
+        if self._america_players is None:
+            self._america_players = self._filter_america_players()
+        # Se entrega una copia: si quien llama la modifica, no altera el resultado guardado
+        america_players = self._america_players.copy()
+        
+        if not verbose:
+            return america_players
         
         print(f"\n{'=' * 60}")
         print("JUGADORES DEL CLUB AMÉRICA")
@@ -283,10 +380,30 @@ class DataProcessor:
         
         # Jugadores por posición
         print("\nDistribución por posición:")
-        print(america_players.groupby('position_category')['player_id'].count())
+        print(america_players.groupby('position_category', observed=True)['player_id'].count())
         
         return america_players
     
+    def _filter_america_players(self) -> pd.DataFrame:
+        """
+        Selecciona las filas de equipos cuyo nombre contiene 'América'
+        
+        Returns:
+            DataFrame con jugadores del América
+        """
+        # Se busca 'América' solo entre los nombres de equipo distintos y luego
+        # se filtran las filas por código de categoría
+        team_names = self.processed_data['team_name']
+        if not isinstance(team_names.dtype, pd.CategoricalDtype):
+            team_names = team_names.astype('category')
+        
+        categories = team_names.cat.categories
+        america_codes = np.flatnonzero(
+            categories.astype(str).str.contains('América', case=False, regex=False)
+        )
+        mask = np.isin(team_names.cat.codes.to_numpy(), america_codes)
+        return self.processed_data[mask]
+    
     def save_processed_data(self, output_dir: str = "data/processed"):
         """
         Guarda los datos procesados en archivos CSV y Parquet
@@ -305,16 +422,16 @@ class DataProcessor:
         parquet_path = output_path / "all_players_processed.parquet"
         
         self.processed_data.to_csv(csv_path, index=False)
-        self.processed_data.to_parquet(parquet_path, index=False)
+        self.processed_data.to_parquet(parquet_path, **PARQUET_OPTIONS)
         
         print(f"\nDatos guardados:")
         print(f"  CSV: {csv_path}")
         print(f"  Parquet: {parquet_path}")
         
         # Guardar jugadores del América
-        america_players = self.get_america_players()
+        america_players = self.get_america_players(verbose=False)
         america_csv = output_path / "america_players.parquet"
-        america_players.to_parquet(america_csv, index=False)
+        america_players.to_parquet(america_csv, **PARQUET_OPTIONS)
         print(f"  América: {america_csv}")
         
         return {
@@ -335,15 +452,22 @@ class DataProcessor:
         
         df = self.processed_data
         
+        # Un solo recorrido por columna: los valores únicos sirven para la lista
+        # y para el conteo (sin NaN, igual que nunique)
+        seasons = df['season_name'].unique()
+        teams = df['team_name'].unique()
+        positions = df['position_category'].value_counts()
+        
         summary = {
             'total_records': len(df),
             'unique_players': df['player_id'].nunique(),
-            'unique_teams': df['team_name'].nunique(),
-            'unique_seasons': df['season_name'].nunique(),
-            'positions': df['position_category'].value_counts().to_dict(),
+            'unique_teams': int(pd.notna(teams).sum()),
+            'unique_seasons': int(pd.notna(seasons).sum()),
+            # Las categorías sin jugadores no se reportan
+            'positions': positions[positions > 0].to_dict(),
             'avg_minutes': df['player_season_minutes'].mean(),
-            'seasons': df['season_name'].unique().tolist(),
-            'teams': df['team_name'].unique().tolist()
+            'seasons': list(seasons),
+            'teams': list(teams)
         }
         
         return summary
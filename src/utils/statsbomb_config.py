@@ -1,13 +1,88 @@
 """
 Configuración principal para el MVP Club América
 """
+import logging
 import os
+from datetime import timedelta
+from types import SimpleNamespace
+
+import requests
+import requests_cache
 from dotenv import load_dotenv
-from statsbombpy import sb
+from requests.adapters import HTTPAdapter
+from statsbombpy import api_client, public, sb
+from urllib3.util.retry import Retry
+
+from .cache import DEFAULT_CACHE_DIR
+
+logger = logging.getLogger(__name__)
 
 # Cargar variables de entorno
 load_dotenv()
 
+# Caché HTTP persistente compartida (statsbombpy solo usa una temporal por proceso)
+HTTP_CACHE_PATH = DEFAULT_CACHE_DIR / 'http_cache'
+HTTP_CACHE_EXPIRE = timedelta(days=1)
+
+# Máximo de peticiones simultáneas a la API (hilos del fetcher); el pool de
+# conexiones HTTP se dimensiona con este valor para que ningún hilo espere
+# ni abra conexiones que luego se descartan
+MAX_WORKERS = 16
+
+_http_session = None
+
+
+def get_http_session() -> requests.Session:
+    """
+    Devuelve la sesión HTTP compartida por todas las llamadas a StatsBomb:
+    conexiones reutilizadas, reintentos con espera exponencial ante 429/5xx
+    y caché HTTP en disco. La primera llamada la instala en statsbombpy.
+    
+    Returns:
+        Sesión HTTP (requests_cache.CachedSession)
+    """
+    global _http_session
+    if _http_session is None:
+        session = requests_cache.CachedSession(
+            str(HTTP_CACHE_PATH), backend='sqlite', expire_after=HTTP_CACHE_EXPIRE
+        )
+        retry = Retry(
+            total=5,
+            backoff_factor=1,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET']
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=MAX_WORKERS, max_retries=retry)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        
+        _install_session(session)
+        _http_session = session
+    return _http_session
+
+
+def _install_session(session: requests.Session):
+    """
+    Hace que statsbombpy use la sesión compartida. statsbombpy (1.x) importa
+    requests como `req` en api_client y public y llama a `req.get(...)`; ese
+    nombre se sustituye por la sesión conservando `req.auth`. Si una versión
+    no tiene ese detalle interno, se deja como está y statsbombpy sigue
+    usando requests directamente (sin pool ni reintentos compartidos)
+    
+    Args:
+        session: Sesión HTTP compartida
+    """
+    shim = SimpleNamespace(get=session.get, auth=requests.auth)
+    for module in (api_client, public):
+        if getattr(module, 'req', None) is requests:
+            module.req = shim
+        else:
+            logger.warning(
+                "statsbombpy.%s no usa `req = requests`; no se instala la sesión HTTP compartida",
+                module.__name__.rsplit('.', 1)[-1]
+            )
+
+
 class StatsBombConfig:
     def __init__(self):
         """Inicializa la configuración de StatsBomb"""
@@ -19,7 +94,9 @@ class StatsBombConfig:
                 "Las credenciales de StatsBomb no están configuradas."
             )
         
-        print(f"Usuario configurado: {self.username}")
+        logger.debug("Usuario configurado: %s", self.username)
+        
+        get_http_session()
     
     def get_credentials(self):
         """Devuelve las credenciales de StatsBomb"""
@@ -42,8 +119,8 @@ class StatsBombConfig:
             mx_competitions = competitions[competitions['country_name'] == 'Mexico']
             if not mx_competitions.empty:
                 print(f"{len(mx_competitions)} competiciones mexicanas encontradas:")
-                for _, comp in mx_competitions.iterrows():
-                    print(f"   - {comp['competition_name']} ({comp['season_name']})")
+                for competition_name, season_name in mx_competitions[['competition_name', 'season_name']].itertuples(index=False, name=None):
+                    print(f"   - {competition_name} ({season_name})")
             else:
                 print("No se encontraron competiciones mexicanas")
             
@@ -1,69 +1,186 @@
 """Utilidades para visualizaciones"""
+import io
 import pandas as pd
-import matplotlib.pyplot as plt
+import matplotlib
 import numpy as np
-from typing import List
+from functools import lru_cache
+from typing import List, Literal, Optional, Tuple
+
+# Configuración de estilo (sin importar pyplot: pyplot y los módulos de dibujo
+# se importan solo al graficar)
+matplotlib.rcParams['figure.figsize'] = (10, 6)
+
+
+@lru_cache(maxsize=1024)
+def _clean_feature_name(feature: str) -> str:
+    """Convierte el nombre de una columna en una etiqueta legible"""
+    return (feature.replace('player_season_', '')
+                   .replace('_norm', '')
+                   .replace('_90', '')
+                   .replace('_', ' ')
+                   .title())
+
+
+@lru_cache(maxsize=64)
+def _clean_features(features: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Etiquetas de una lista de features (se repiten entre recargas de la app)"""
+    return tuple(_clean_feature_name(f) for f in features)
+
+
+@lru_cache(maxsize=32)
+def _closed_angles(n: int) -> np.ndarray:
+    """Ángulos de un radar de `n` ejes, repitiendo el primero para cerrar el polígono"""
+    angles = np.linspace(0.0, 2 * np.pi, n, endpoint=False)
+    closed = np.concatenate([angles, angles[:1]])
+    closed.flags.writeable = False  # compartido entre llamadas
+    return closed
+
+
+def _close(values: np.ndarray) -> np.ndarray:
+    """
+    Repite el primer valor al final del último eje para cerrar el polígono
+    del radar, en un arreglo preasignado
+    
+    Args:
+        values: Valores de un jugador (1D) o de varios (jugadores x features)
+        
+    Returns:
+        Arreglo con una columna más que la entrada
+    """
+    closed = np.empty(values.shape[:-1] + (values.shape[-1] + 1,), dtype=values.dtype)
+    closed[..., :-1] = values
+    closed[..., -1:] = values[..., :1]
+    return closed
+
+
+@lru_cache(maxsize=64)
+def _rgba(colors: Tuple[str, ...], alpha: Optional[float] = None) -> np.ndarray:
+    """
+    Colores RGBA con la transparencia ya aplicada, convertidos una sola vez
+    por paleta en lugar de en cada dibujo
+    
+    Args:
+        colors: Colores en cualquier formato de matplotlib
+        alpha: Transparencia a aplicar (opcional)
+        
+    Returns:
+        Matriz (n_colores x 4) de solo lectura
+    """
+    from matplotlib.colors import to_rgba_array
+    
+    rgba = to_rgba_array(colors, alpha)
+    rgba.flags.writeable = False  # compartido entre llamadas
+    return rgba
+
+
+def _minmax_margin(values: np.ndarray, pct: float) -> Tuple[float, float]:
+    """
+    Límites de una escala que cubre todos los valores con un margen relativo
+    
+    Args:
+        values: Matriz de valores (se ignoran los NaN)
+        pct: Margen como fracción del rango
+        
+    Returns:
+        Tupla (mínimo - margen, máximo + margen); (0, 1) si no hay valores
+    """
+    present = values[~np.isnan(values)]
+    if present.size == 0:
+        return 0.0, 1.0
+    low, high = present.min(), present.max()
+    margin = (high - low) * pct
+    return low - margin, high + margin
+
+
+def _polar_figure(figsize: Tuple[float, float] = (8, 8)):
+    """
+    Crea una figura polar con pyplot, para que `plt.show()` la muestre en
+    notebooks. Quien no la muestre debe cerrarla (`plt.close(fig)`) para que
+    no se acumulen figuras abiertas
+    """
+    import matplotlib.pyplot as plt
+    
+    return plt.subplots(figsize=figsize, subplot_kw=dict(projection='polar'))
 
-# Configuración de estilo
-plt.rcParams['figure.figsize'] = (10, 6)
 
 def plot_comparison_radar(
     players_data: pd.DataFrame,
     player_names: List[str],
     features: List[str],
-    title: str = "Comparación de Jugadores"
+    title: str = "Comparación de Jugadores",
+    style: Literal['fixed', 'auto'] = 'auto'
 ):
+    """
+    Crea un gráfico de radar comparando a varios jugadores
+    
+    Args:
+        players_data: DataFrame con los datos de los jugadores
+        player_names: Nombres de los jugadores a comparar
+        features: Lista de features a mostrar
+        title: Título del gráfico
+        style: Escala radial: 'fixed' para [0, 1] (features en ratios o
+            percentiles) o 'auto' para ajustarla a los valores con un margen de 10%
+        
+    Returns:
+        Figure de matplotlib
+    """
+    from matplotlib.collections import PolyCollection
+    
     colors = ['#00529F', '#FDB913', '#E4002B', '#00A859']
 
-    fig, ax = plt.subplots(figsize=(8, 8), subplot_kw=dict(projection='polar'))
+    fig, ax = _polar_figure()
 
     # Limpiar nombres de features
-    categories = [
-        f.replace('player_season_', '')
-         .replace('_norm', '')
-         .replace('_90', '')
-         .replace('_', ' ')
-         .title() 
-        for f in features
-    ]
-    
-    N = len(categories)
-    angles = np.linspace(0, 2 * np.pi, N, endpoint=False).tolist()
-    angles += angles[:1]
-
-    # Obtener valores globales para ajustar los límites
-    selected = players_data[players_data['player_name'].isin(player_names)][features]
-    global_min = selected.min().min()
-    global_max = selected.max().max()
-    margin = (global_max - global_min) * 0.1  # margen de 10%
-    
-    for idx, name in enumerate(player_names):
-        player = players_data.loc[players_data['player_name'] == name]
-        if player.empty:
+    categories = _clean_features(tuple(features))
+    
+    angles = _closed_angles(len(categories))
+
+    # Una sola pasada sobre el DataFrame: filas de los jugadores pedidos
+    # (la primera si un nombre se repite) indexadas por nombre
+    selected = players_data.loc[players_data['player_name'].isin(player_names), ['player_name'] + list(features)]
+    lookup = selected.drop_duplicates('player_name').set_index('player_name')
+    
+    present = [(idx, name) for idx, name in enumerate(player_names) if name in lookup.index]
+    for name in player_names:
+        if name not in lookup.index:
             print(f"Jugador '{name}' no encontrado")
-            continue
+    
+    values_mat = lookup.loc[[name for _, name in present], features].to_numpy(dtype=np.float32)
+    
+    # Cerrar el polígono de todos los jugadores de una vez
+    closed_mat = _close(values_mat)
+    
+    # Rellenos de todos los jugadores en una sola colección; contornos y
+    # marcadores en una sola llamada a plot (una línea por jugador, en el mismo
+    # orden de dibujo que antes)
+    player_colors = [colors[idx % len(colors)] for idx, _ in present]
+    if present:
+        fill_rgba = _rgba(tuple(player_colors), 0.15)
+        segments = np.stack([np.broadcast_to(angles, closed_mat.shape), closed_mat], axis=-1)
+        ax.add_collection(PolyCollection(segments, facecolors=fill_rgba, edgecolors=fill_rgba, linewidths=1, joinstyle='miter'))
         
-        player = player.iloc[0]
-        values = player[features].astype(float).values.tolist()
-        values += values[:1]
-        color = colors[idx % len(colors)]
-
-        ax.plot(angles, values, 'o-', linewidth=2, label=name, color=color)
-        ax.fill(angles, values, alpha=0.15, color=color)
+        lines = ax.plot(angles, closed_mat.T, 'o-', linewidth=2)
+        for line, (_, name), color in zip(lines, present, player_colors):
+            line.set_color(color)
+            line.set_label(name)
 
     # Configuración de ejes
     ax.set_xticks(angles[:-1])
     ax.set_xticklabels(categories, size=10)
     ax.set_yticklabels([])  # sin etiquetas radiales
-    ax.set_ylim(global_min - margin, global_max + margin)
+    if style == 'fixed':
+        ax.set_ylim(0, 1)
+    else:
+        # Límites globales con margen de 10%, sobre todas las filas de los
+        # jugadores pedidos (todas sus temporadas, no solo la graficada)
+        ax.set_ylim(*_minmax_margin(selected[features].to_numpy(dtype=np.float64), 0.1))
 
     # Estética
     ax.set_title(title, size=16, pad=30)
     ax.legend(loc='upper left', bbox_to_anchor=(1.1, 1.05))
     ax.grid(True)
 
-    plt.subplots_adjust(left=0.05, right=0.85, top=0.9, bottom=0.05)
-    plt.show()
+    fig.subplots_adjust(left=0.05, right=0.85, top=0.9, bottom=0.05)
     return fig
 
 def plot_radar_chart(
@@ -85,35 +202,46 @@ def plot_radar_chart(
         Figure de matplotlib
     """
     # Preparar categorías
-    categories = [
-        f.replace('player_season_', '')
-         .replace('_norm', '')
-         .replace('_90', '')
-         .replace('_', ' ')
-         .title() 
-        for f in features
-    ]
+    categories = _clean_features(tuple(features))
     
-    # Obtener valores
-    values = player_data[features].values.tolist()
-    
-    # Número de variables
-    N = len(categories)
+    # Obtener valores (cerrando el polígono)
+    values = _close(player_data[features].to_numpy(dtype=np.float32, copy=False))
     
     # Ángulos
-    angles = [n / float(N) * 2 * np.pi for n in range(N)]
-    values += values[:1]
-    angles += angles[:1]
+    angles = _closed_angles(len(categories))
     
     # Plot
-    fig, ax = plt.subplots(figsize=(8, 8), subplot_kw=dict(projection='polar'))
+    fig, ax = _polar_figure()
     ax.plot(angles, values, 'o-', linewidth=2, color=color)
-    ax.fill(angles, values, alpha=0.25, color=color)
+    ax.fill(angles, values, color=_rgba((color,), 0.25)[0])
     ax.set_xticks(angles[:-1])
     ax.set_xticklabels(categories)
     ax.set_ylim(0, 1)
     ax.set_title(title, size=16, pad=20)
     ax.grid(True)
     
-    plt.tight_layout()
-    return fig
\ No newline at end of file
+    # Márgenes fijos (equivalentes a tight_layout para este radar) para no
+    # resolver el layout en cada dibujo
+    fig.subplots_adjust(left=0.13, right=0.9, top=0.9, bottom=0.05)
+    return fig
+
+
+def figure_to_png(fig, dpi: int = 100, close: bool = True) -> bytes:
+    """
+    Renderiza una figura a PNG en una sola pasada, para mostrarla con
+    `st.image` sin que Streamlit vuelva a serializar la figura
+    
+    Args:
+        fig: Figure de matplotlib
+        dpi: Resolución de salida
+        close: Cerrar la figura en pyplot después de renderizarla
+        
+    Returns:
+        Bytes del PNG
+    """
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=dpi, bbox_inches=None, metadata={'Software': None})
+    if close:
+        import matplotlib.pyplot as plt
+        plt.close(fig)
+    return buffer.getvalue()
@@ -2,6 +2,7 @@
 Streamlit Cloud Entry Point
 This is a simplified version of app.py for Streamlit Cloud deployment
 """
+import importlib
 import streamlit as st
 import os
 from pathlib import Path
@@ -38,13 +39,20 @@ if "STREAMLIT_SHARING" in os.environ:
         """)
         # Don't stop, allow the app to continue
 
-# Import the main app
-try:
-    from app import main
-    main()
-except ImportError as e:
-    st.error(f"❌ Error importando la aplicación: {e}")
-    st.info("💡 Asegúrate de que todos los archivos estén presentes en el repositorio")
-except Exception as e:
-    st.error(f"❌ Error ejecutando la aplicación: {e}")
-    st.info("💡 Revisa los logs para más detalles")
+def _run():
+    """Import the main app (pandas, plotly, scikit-learn...) only when it is rendered"""
+    try:
+        app = importlib.import_module('app')
+        app.main()
+    except ImportError as e:
+        st.error(f"❌ Error importando la aplicación: {e}")
+        st.info("💡 Asegúrate de que todos los archivos estén presentes en el repositorio")
+    except Exception as e:
+        st.error(f"❌ Error ejecutando la aplicación: {e}")
+        st.info("💡 Revisa los logs para más detalles")
+
+
+# `streamlit run` executes this file as __main__; importing it (tooling,
+# deployment checks) does not load the app
+if __name__ == '__main__':
+    _run()